@@ -16,8 +16,7 @@ Diseño: Complejidad por diseño
 - Controller solo usa Builder (no conoce detalles)
 - Toda la lógica de construcción centralizada aquí
 """
-from functools import partial
-from typing import Optional, Tuple, List, Callable, Any, Union, TYPE_CHECKING
+from typing import Optional, Tuple, List, Callable, Any, Dict, Union, TYPE_CHECKING
 import logging
 
 # Type-only imports (no circular import en runtime)
@@ -25,24 +24,49 @@ if TYPE_CHECKING:
     from ..data import MQTTDataPlane
     from ..inference.roi import ROIState, FixedROIState
 
-# Lazy loading inference con disable automático
-from ..inference.loader import InferenceLoader
-
-inference_module = InferenceLoader.get_inference()
-InferencePipeline = inference_module.InferencePipeline
+# Lazy loading inference (único punto que resuelve InferencePipeline)
+from ..inference.loader import InferencePipeline
 
 # Otros imports de inference
-from inference.core.interfaces.stream.sinks import multi_sink
 from inference.core.interfaces.stream.watchdog import BasePipelineWatchDog
 
 from ..config import PipelineConfig
 from ..inference.factories import InferenceHandlerFactory, StrategyFactory
 from ..inference.handlers.base import BaseInferenceHandler
+from ..inference.stabilization import create_stabilization_sink
 from .factories import SinkFactory
 
 logger = logging.getLogger(__name__)
 
 
+def _log_sink_error(sink: Callable, error: Exception) -> None:
+    """Mismo contrato que multi_sink: un sink que falla no corta a los demás."""
+    logger.error(
+        "Could not send prediction and/or frame to sink",
+        extra={
+            "component": "builder",
+            "event": "sink_error",
+            "sink_name": getattr(sink, '__name__', type(sink).__name__),
+            "error": str(error),
+            "error_type": type(error).__name__,
+        }
+    )
+
+
+def _log_status_handler_error(handler: Callable, error: Exception) -> None:
+    """Un status handler que falla no corta a los demás."""
+    logger.warning(
+        "Status update handler failed",
+        extra={
+            "component": "builder",
+            "event": "status_handler_error",
+            "handler_name": getattr(handler, '__name__', type(handler).__name__),
+            "error": str(error),
+            "error_type": type(error).__name__,
+        }
+    )
+
+
 class PipelineBuilder:
     """
     Builder para InferencePipeline.
@@ -72,6 +96,7 @@ class PipelineBuilder:
         """
         self.config = config
         self.stabilizer = None  # Se crea en wrap_sinks_with_stabilization()
+        self.sink_index: Dict[str, int] = {}  # Se llena en build_sinks()
 
     def build_inference_handler(
         self
@@ -97,6 +122,7 @@ class PipelineBuilder:
         data_plane: 'MQTTDataPlane',
         roi_state: Optional[Union['ROIState', 'FixedROIState']] = None,
         inference_handler: Optional[BaseInferenceHandler] = None,
+        data_planes: Optional[List['MQTTDataPlane']] = None,
     ) -> List[Callable]:
         """
         Construye sinks según configuración.
@@ -107,20 +133,26 @@ class PipelineBuilder:
             data_plane: MQTTDataPlane (type-safe via TYPE_CHECKING)
             roi_state: ROIState | FixedROIState | None
             inference_handler: BaseInferenceHandler | None
+            data_planes: Pool de conexiones del data plane (incluye data_plane) | None
 
         Returns:
-            Lista de sinks para multi_sink()
+            Lista de sinks para on_prediction
+
+        Side effects:
+            - Setea self.sink_index (nombre registrado -> posición en la lista)
         """
         logger.info(
             "Building sinks",
             extra={"component": "builder", "event": "sinks_build_start"}
         )
-        return SinkFactory.create_sinks(
+        sinks, self.sink_index = SinkFactory.create_sinks(
             config=self.config,
             data_plane=data_plane,
             roi_state=roi_state,
             inference_handler=inference_handler,
+            data_planes=data_planes,
         )
+        return sinks
 
     def wrap_sinks_with_stabilization(self, sinks: List[Callable]) -> List[Callable]:
         """
@@ -137,7 +169,8 @@ class PipelineBuilder:
 
         Note:
             Functional purity: No modifica input, retorna nuevo array.
-            Explicit over implicit: Busca MQTT sink por __name__, no por posición.
+            Explicit over implicit: Ubica el MQTT sink por nombre registrado
+            (self.sink_index['mqtt'], O(1)) y verifica su __name__.
 
         Raises:
             ValueError: Si stabilization está habilitado pero no hay MQTT sink
@@ -159,26 +192,26 @@ class PipelineBuilder:
             extra={"component": "builder", "event": "stabilization_wrap_start"}
         )
 
-        from ..inference.stabilization import create_stabilization_sink
-
         # Crear stabilizer usando factory
         self.stabilizer = StrategyFactory.create_stabilization_strategy(self.config)
 
-        # Buscar MQTT sink explícitamente por __name__ (no asumir posición)
-        mqtt_sink_idx = None
-        for i, sink in enumerate(sinks):
-            if hasattr(sink, '__name__') and sink.__name__ == 'mqtt_sink':
-                mqtt_sink_idx = i
-                break
+        # Ubicar MQTT sink por índice del registry (no asumir posición)
+        mqtt_sink_idx = self.sink_index.get('mqtt')
 
-        if mqtt_sink_idx is None:
+        if (
+            mqtt_sink_idx is None
+            or mqtt_sink_idx >= len(sinks)
+            or getattr(sinks[mqtt_sink_idx], '__name__', None) != 'mqtt_sink'
+        ):
             raise ValueError(
                 "No MQTT sink found to wrap with stabilization. "
-                "Ensure SinkFactory creates MQTT sink with __name__ = 'mqtt_sink'."
+                "Ensure sinks come from build_sinks() and SinkFactory creates "
+                "MQTT sink with __name__ = 'mqtt_sink'."
             )
 
         logger.info(
-            f"Found MQTT sink at index {mqtt_sink_idx}",
+            "Found MQTT sink at index %d",
+            mqtt_sink_idx,
             extra={
                 "component": "builder",
                 "event": "mqtt_sink_found",
@@ -192,12 +225,12 @@ class PipelineBuilder:
             downstream_sink=mqtt_sink,
         )
 
-        # Reconstruir lista con MQTT sink wrappeado (immutable operation)
-        new_sinks = (
-            sinks[:mqtt_sink_idx] +
-            [stabilized_sink] +
-            sinks[mqtt_sink_idx+1:]
-        )
+        # Copia con MQTT sink wrappeado (el input no se modifica)
+        if len(sinks) == 1:
+            new_sinks = [stabilized_sink]
+        else:
+            new_sinks = list(sinks)
+            new_sinks[mqtt_sink_idx] = stabilized_sink
 
         logger.info(
             "Stabilization wrapper complete",
@@ -234,29 +267,39 @@ class PipelineBuilder:
             extra={"component": "builder", "event": "pipeline_build_start"}
         )
 
-        # Composición de sinks
-        on_prediction = partial(multi_sink, sinks=sinks)
+        # Composición de sinks (un solo callable, sin partial de multi_sink)
+        on_prediction = self._fuse_sinks(sinks)
+
+        # Status handlers en un único dispatcher
+        status_update_handlers = [self._fuse_status_handlers(status_update_handlers)]
+
+        # Config leída una sola vez antes de ramificar
+        config = self.config
+        roi_mode = config.ROI_MODE
+        rtsp_url = config.RTSP_URL
+        max_fps = config.MAX_FPS
 
         # Standard vs Custom Logic
-        if self.config.ROI_MODE == 'none':
+        if roi_mode == 'none':
             # ============================================================
             # STANDARD PIPELINE (model_id based)
             # ============================================================
+            model_id = config.MODEL_ID
             logger.info(
                 "Creating standard pipeline",
                 extra={
                     "component": "builder",
                     "event": "pipeline_created",
                     "pipeline_type": "standard",
-                    "model_id": self.config.MODEL_ID
+                    "model_id": model_id
                 }
             )
             pipeline = InferencePipeline.init(
-                max_fps=self.config.MAX_FPS,
-                model_id=self.config.MODEL_ID,
-                video_reference=self.config.RTSP_URL,
+                max_fps=max_fps,
+                model_id=model_id,
+                video_reference=rtsp_url,
                 on_prediction=on_prediction,
-                api_key=self.config.API_KEY,
+                api_key=config.API_KEY,
                 watchdog=watchdog,
                 status_update_handlers=status_update_handlers,
             )
@@ -271,14 +314,14 @@ class PipelineBuilder:
                     "component": "builder",
                     "event": "pipeline_created",
                     "pipeline_type": "custom_logic",
-                    "roi_mode": self.config.ROI_MODE
+                    "roi_mode": roi_mode
                 }
             )
             pipeline = InferencePipeline.init_with_custom_logic(
-                video_reference=self.config.RTSP_URL,
+                video_reference=rtsp_url,
                 on_video_frame=inference_handler,
                 on_prediction=on_prediction,
-                max_fps=self.config.MAX_FPS,
+                max_fps=max_fps,
                 watchdog=watchdog,
                 status_update_handlers=status_update_handlers,
             )
@@ -288,3 +331,58 @@ class PipelineBuilder:
             extra={"component": "builder", "event": "pipeline_build_complete"}
         )
         return pipeline
+
+    @staticmethod
+    def _fuse_sinks(sinks: List[Callable]) -> Callable:
+        """
+        Compone los sinks en una única función (reemplaza multi_sink).
+
+        Args:
+            sinks: Lista de sinks (orden = orden de ejecución)
+
+        Returns:
+            Callable(predictions, video_frame) compatible con on_prediction
+
+        Note:
+            Mismo contrato que multi_sink: la excepción de un sink se loguea
+            y no impide ejecutar los siguientes.
+
+            Loop sobre una tupla, sin desenrollar con código generado: con
+            1-3 sinks el loop no se mide frente al costo de cada sink, y
+            exec/compile dejaba frames sin fuente en los tracebacks.
+        """
+        sinks = tuple(sinks)
+
+        def fused_sink(predictions, video_frame):
+            for sink in sinks:
+                try:
+                    sink(predictions, video_frame)
+                except Exception as error:
+                    _log_sink_error(sink, error)
+
+        return fused_sink
+
+    @staticmethod
+    def _fuse_status_handlers(handlers: List[Callable]) -> Callable:
+        """
+        Compone los status update handlers en un único dispatcher.
+
+        Mismo contrato que _fuse_sinks: un handler que falla se loguea y
+        no corta a los demás.
+
+        Args:
+            handlers: Handlers de StatusUpdate (orden = orden de ejecución)
+
+        Returns:
+            Callable(status_update)
+        """
+        handlers = tuple(handlers)
+
+        def fused_status_handler(status_update):
+            for handler in handlers:
+                try:
+                    handler(status_update)
+                except Exception as error:
+                    _log_status_handler_error(handler, error)
+
+        return fused_status_handler
@@ -8,37 +8,32 @@ Data Plane: Publica resultados de inferencia vía MQTT
 import os
 import signal
 import sys
+import _thread
+import contextvars
 import logging
-import yaml
 import json
 import time
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from threading import Event
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 # ============================================================================
-# LAZY LOADING INFERENCE (con disable automático)
+# IMPORTS DE INFERENCE
 # ============================================================================
-# InferenceLoader garantiza que disable_models_from_config() se ejecute
-# ANTES de importar inference (enforced por diseño, no por comentarios)
-from ..inference.loader import InferenceLoader
-
-# Get inference module (disable automático)
-inference_module = InferenceLoader.get_inference()
-InferencePipeline = inference_module.InferencePipeline
-
-# Otros imports de inference (estos NO necesitan lazy loading)
-from inference.core.interfaces.stream.sinks import multi_sink
+# InferencePipeline se resuelve una sola vez vía InferenceLoader, en builder.py
+# (el controller no construye el pipeline, solo lo orquesta)
 from inference.core.interfaces.camera.entities import StatusUpdate, UpdateSeverity
 from inference.core.interfaces.stream.watchdog import BasePipelineWatchDog
 
 # Internal imports (new package structure)
 from ..control import MQTTControlPlane
-from ..data import MQTTDataPlane
+from ..data import MQTTDataPlane, NullDataPlane
 from ..config import PipelineConfig, AdelineConfig
 from .. import __version__
 from .builder import PipelineBuilder
@@ -50,6 +45,42 @@ from pydantic import ValidationError
 # Logger (será configurado en main() con config values)
 logger = logging.getLogger(__name__)
 
+# Status updates por debajo de WARNING (resueltos una vez): el chequeo por
+# frame es `in` sobre una tupla chica (identidad), sin el descriptor .value
+_QUIET_SEVERITIES = tuple(
+    severity for severity in UpdateSeverity
+    if severity.value < UpdateSeverity.WARNING.value
+)
+
+# Señales que piden shutdown (ver run()/_signal_waiter)
+_SHUTDOWN_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+# Tope para los disconnects MQTT en cleanup (el flush del sink asíncrono
+# espera hasta 5s por su worker)
+_DISCONNECT_TIMEOUT_S = 10.0
+
+# Reporte de STABILIZATION_STATS: defaults + template (un solo format/log)
+_STATS_DEFAULTS = {
+    'total_detected': 0,
+    'total_confirmed': 0,
+    'total_ignored': 0,
+    'total_removed': 0,
+    'active_tracks': 0,
+    'confirm_ratio': 0.0,
+    'tracks_by_class': {},
+}
+_STATS_TEMPLATE = (
+    "📈 Detection Stabilization Stats:\n"
+    "   Mode: %(mode)s\n"
+    "   Total detected: %(total_detected)s\n"
+    "   Total confirmed: %(total_confirmed)s\n"
+    "   Total ignored: %(total_ignored)s\n"
+    "   Total removed: %(total_removed)s\n"
+    "   Active tracks: %(active_tracks)s\n"
+    "   Confirm ratio: %(confirm_pct).2f%%"
+    "%(by_class)s"
+)
+
 
 # ============================================================================
 # PIPELINE CONTROLLER
@@ -74,14 +105,36 @@ class InferencePipelineController:
     - SRP: Solo maneja lifecycle, no detalles de construcción
     """
 
+    # Comandos MQTT: (comando, handler, descripción, es_consulta, disponible)
+    # - es_consulta: solo lectura → cola de queries (ver _setup_control_callbacks)
+    # - disponible: predicado sobre el controller (None = siempre registrado)
+    _COMMAND_SPEC = (
+        ('pause', '_handle_pause', "Pausa el procesamiento", False, None),
+        ('resume', '_handle_resume', "Reanuda el procesamiento", False, None),
+        ('stop', '_handle_stop', "Detiene y finaliza el pipeline", False, None),
+        ('status', '_handle_status', "Consulta estado actual", False, None),
+        ('metrics', '_handle_metrics', "Publica métricas del pipeline", True, None),
+        ('health', '_handle_health_check', "Health check del sistema", True, None),
+        ('toggle_crop', '_handle_toggle_crop', "Toggle adaptive ROI crop", False,
+         lambda self: bool(self.inference_handler and self.inference_handler.supports_toggle)),
+        ('stabilization_stats', '_handle_stabilization_stats', "Estadísticas de estabilización", True,
+         lambda self: self.stabilizer is not None),
+    )
+
     def __init__(self, config: PipelineConfig):
         self.config = config
+
+        # Modos (constantes de config) consultados por callbacks y run()
+        self._is_adaptive = config.ROI_MODE == 'adaptive'
+        self._is_stab_on = config.STABILIZATION_MODE != 'none'
+
         self.builder = PipelineBuilder(config)  # Builder para construcción
 
         # Componentes (serán creados por builder en setup)
         self.pipeline = None
         self.control_plane = None
         self.data_plane = None
+        self.data_planes = []  # Pool (data_planes[0] es data_plane)
         self.watchdog = BasePipelineWatchDog()  # Monitoreo de métricas
 
         # Estado (será seteado por builder)
@@ -91,7 +144,29 @@ class InferencePipelineController:
 
         # Lifecycle
         self.shutdown_event = Event()
-        self.is_running = False
+        self._setup_done = False
+        self._signal_waiter_done = False
+        # Serializa el signal-waiter con el fin de setup() y con su propio stop
+        self._signal_lock = Lock()
+        # Seteado = pipeline no corriendo (antes de start o ya terminado).
+        # Lo consultan el worker de comandos, métricas y cleanup.
+        self._terminated = Event()
+        self._terminated.set()
+        self._terminate_lock = Lock()
+
+        # Comandos MQTT: se ejecutan en workers propios, no en el thread
+        # de red de paho (evita trabar keep-alives con handlers lentos).
+        # Lifecycle (pause/resume/stop/...) en orden en _cmd_queue; consultas
+        # de solo lectura (metrics/health/stats) aparte, para que una
+        # consulta lenta no demore un STOP
+        self._cmd_queue: Queue = Queue(maxsize=64)
+        self._query_queue: Queue = Queue(maxsize=64)
+        self._cmd_workers = []
+
+        # Métricas: un thread las publica cada METRICS_INTERVAL_S; mientras
+        # corre, el comando METRICS re-publica su último snapshot
+        self._metrics_snapshot = None
+        self._metrics_worker = None
         
     def setup(self):
         """
@@ -105,6 +180,8 @@ class InferencePipelineController:
         Returns:
             bool: True si setup exitoso, False si falla
         """
+        config = self.config
+
         logger.info(
             "🚀 Inicializando InferencePipeline con MQTT",
             extra={
@@ -113,36 +190,57 @@ class InferencePipelineController:
             }
         )
 
+        # Conexiones MQTT en paralelo: cada connect() (handshake + CONNACK,
+        # hasta 10s) corre en background, solapado entre sí y con la carga
+        # del modelo; se esperan todas juntas al final del paso 6
+        connections = []  # (componente, plane, future)
+
         # ====================================================================
         # 1. Configurar Data Plane (publicador de inferencias)
         # ====================================================================
-        logger.info(
-            "📡 Configurando Data Plane",
-            extra={
-                "component": "controller",
-                "event": "data_plane_setup",
-            }
-        )
-        self.data_plane = MQTTDataPlane(
-            broker_host=self.config.MQTT_BROKER,
-            broker_port=self.config.MQTT_PORT,
-            data_topic=self.config.DATA_TOPIC,
-            metrics_topic=self.config.METRICS_TOPIC,
-            username=self.config.MQTT_USERNAME,
-            password=self.config.MQTT_PASSWORD,
-            qos=self.config.DATA_QOS,
-        )
+        if config.MQTT_ENABLED:
+            connector = ThreadPoolExecutor(
+                max_workers=config.DATA_PLANE_POOL_SIZE + 1,
+                thread_name_prefix="mqtt-connect",
+            )
 
-        if not self.data_plane.connect(timeout=10):
-            log_error_with_context(
-                logger,
-                message="❌ No se pudo conectar Data Plane",
-                component="controller",
-                event="data_plane_connection_failed",
-                broker_host=self.config.MQTT_BROKER,
-                broker_port=self.config.MQTT_PORT,
+            logger.info(
+                "📡 Configurando Data Plane",
+                extra={
+                    "component": "controller",
+                    "event": "data_plane_setup",
+                }
             )
-            return False
+            # Pool de conexiones (DATA_PLANE_POOL_SIZE, default 1). La primera es
+            # el data plane principal (métricas, stats); client_id único por conexión
+            for i in range(config.DATA_PLANE_POOL_SIZE):
+                plane = MQTTDataPlane(
+                    broker_host=config.MQTT_BROKER,
+                    broker_port=config.MQTT_PORT,
+                    data_topic=config.DATA_TOPIC,
+                    metrics_topic=config.METRICS_TOPIC,
+                    client_id="inference_data" if i == 0 else f"inference_data_{i}",
+                    username=config.MQTT_USERNAME,
+                    password=config.MQTT_PASSWORD,
+                    qos=config.DATA_QOS,
+                    metrics_qos=config.METRICS_QOS,
+                )
+                self.data_planes.append(plane)
+                connections.append(
+                    ("data_plane", plane, connector.submit(plane.connect, 10))
+                )
+        else:
+            # Modo offline: sin broker, sin publicaciones
+            logger.info(
+                "📴 MQTT deshabilitado (mqtt.enabled=false)",
+                extra={
+                    "component": "controller",
+                    "event": "mqtt_disabled",
+                }
+            )
+            self.data_planes = [NullDataPlane()]
+
+        self.data_plane = self.data_planes[0]
 
         # Conectar watchdog para publicar métricas
         self.data_plane.set_watchdog(self.watchdog)
@@ -159,12 +257,14 @@ class InferencePipelineController:
             data_plane=self.data_plane,
             roi_state=self.roi_state,
             inference_handler=self.inference_handler,
+            data_planes=self.data_planes,
         )
 
         # ====================================================================
         # 4. Wrap con Stabilization si necesario (DELEGADO A BUILDER)
+        #    (estabiliza lo que se publica: sin MQTT no hay sink que wrappear)
         # ====================================================================
-        if self.config.STABILIZATION_MODE != 'none':
+        if self._is_stab_on and config.MQTT_ENABLED:
             sinks = self.builder.wrap_sinks_with_stabilization(sinks)
             self.stabilizer = self.builder.stabilizer
         else:
@@ -181,37 +281,49 @@ class InferencePipelineController:
         )
 
         # ====================================================================
-        # 6. Configurar Control Plane (receptor de comandos)
+        # 6. Configurar Control Plane (receptor de comandos, solo con MQTT)
         # ====================================================================
-        logger.info(
-            "🎮 Configurando Control Plane",
-            extra={
-                "component": "controller",
-                "event": "control_plane_setup",
-            }
-        )
-        self.control_plane = MQTTControlPlane(
-            broker_host=self.config.MQTT_BROKER,
-            broker_port=self.config.MQTT_PORT,
-            command_topic=self.config.CONTROL_COMMAND_TOPIC,
-            status_topic=self.config.CONTROL_STATUS_TOPIC,
-            username=self.config.MQTT_USERNAME,
-            password=self.config.MQTT_PASSWORD,
-        )
+        if config.MQTT_ENABLED:
+            logger.info(
+                "🎮 Configurando Control Plane",
+                extra={
+                    "component": "controller",
+                    "event": "control_plane_setup",
+                }
+            )
+            self.control_plane = MQTTControlPlane(
+                broker_host=config.MQTT_BROKER,
+                broker_port=config.MQTT_PORT,
+                command_topic=config.CONTROL_COMMAND_TOPIC,
+                status_topic=config.CONTROL_STATUS_TOPIC,
+                username=config.MQTT_USERNAME,
+                password=config.MQTT_PASSWORD,
+            )
 
-        # Configurar callbacks
-        self._setup_control_callbacks()
+            # Configurar callbacks (+ workers que los ejecutan) ANTES de
+            # conectar: un comando puede llegar apenas termina el handshake
+            self._setup_control_callbacks()
+            for name, queue in (
+                ("control-commands", self._cmd_queue),
+                ("control-queries", self._query_queue),
+            ):
+                worker = Thread(
+                    target=self._cmd_loop,
+                    args=(queue,),
+                    name=name,
+                    daemon=True,
+                )
+                worker.start()
+                self._cmd_workers.append(worker)
 
-        if not self.control_plane.connect(timeout=10):
-            log_error_with_context(
-                logger,
-                message="❌ No se pudo conectar Control Plane",
-                component="controller",
-                event="control_plane_connection_failed",
-                broker_host=self.config.MQTT_BROKER,
-                broker_port=self.config.MQTT_PORT,
+            connections.append(
+                ("control_plane", self.control_plane,
+                 connector.submit(self.control_plane.connect, 10))
             )
-            return False
+            connector.shutdown(wait=False)
+
+            if not self._await_connections(connections):
+                return False
 
         # ====================================================================
         # 7. Auto-iniciar el pipeline
@@ -223,8 +335,13 @@ class InferencePipelineController:
                 "event": "pipeline_start_requested",
             }
         )
+        # Threads heredan la afinidad del thread que los crea: fijar el main
+        # thread antes de start() deja los workers del pipeline en esos cores
+        if config.INFERENCE_CPUS:
+            self._set_thread_affinity(0, config.INFERENCE_CPUS, "inference")
+
         try:
-            self.is_running = True
+            self._terminated.clear()
             self.pipeline.start()
             logger.info(
                 "✅ Pipeline iniciado y corriendo",
@@ -241,9 +358,20 @@ class InferencePipelineController:
                 component="controller",
                 event="pipeline_start_failed",
             )
-            self.is_running = False
+            self._terminated.set()
             return False
 
+        if config.MQTT_ENABLED and config.METRICS_INTERVAL_S > 0:
+            self._metrics_worker = Thread(
+                target=self._metrics_loop,
+                name="metrics-publisher",
+                daemon=True,
+            )
+            self._metrics_worker.start()
+
+        if config.IO_CPUS:
+            self._pin_io_threads(config.IO_CPUS)
+
         logger.info(
             "✅ Setup completado",
             extra={
@@ -253,46 +381,250 @@ class InferencePipelineController:
         )
         return True
 
+    def _pin_io_threads(self, cpus) -> None:
+        """
+        Fija los threads de I/O a IO_CPUS (fuera de los cores de inferencia).
+
+        Incluye los network loops de paho (uno por cliente MQTT) y los
+        workers propios de comandos y métricas.
+        """
+        planes = [*self.data_planes, self.control_plane]
+        threads = [
+            getattr(getattr(plane, 'client', None), '_thread', None)
+            for plane in planes
+        ]
+        threads += [*self._cmd_workers, self._metrics_worker]
+
+        for thread in threads:
+            if thread is not None and thread.native_id is not None:
+                self._set_thread_affinity(thread.native_id, cpus, thread.name)
+
+    @staticmethod
+    def _set_thread_affinity(thread_id: int, cpus, label: str) -> None:
+        """
+        Fija la afinidad de CPU de un thread (Linux; thread_id 0 = actual).
+
+        Best effort: si la plataforma no lo soporta o los cores no existen
+        se loguea warning y se sigue sin pinning.
+        """
+        if not hasattr(os, 'sched_setaffinity'):
+            logger.warning(
+                "⚠️ CPU pinning no soportado en esta plataforma",
+                extra={
+                    "component": "controller",
+                    "event": "cpu_affinity_unsupported",
+                    "target_thread": label,
+                }
+            )
+            return
+
+        try:
+            os.sched_setaffinity(thread_id, cpus)
+        except OSError as e:
+            logger.warning(
+                "⚠️ No se pudo fijar afinidad de CPU: %s",
+                e,
+                extra={
+                    "component": "controller",
+                    "event": "cpu_affinity_failed",
+                    "target_thread": label,
+                    "cpus": list(cpus),
+                }
+            )
+            return
+
+        logger.debug(
+            "CPU affinity set",
+            extra={
+                "component": "controller",
+                "event": "cpu_affinity_set",
+                "target_thread": label,
+                "cpus": list(cpus),
+            }
+        )
+
+    def _await_connections(self, connections) -> bool:
+        """
+        Espera los connect() lanzados en setup() en orden de llegada.
+
+        Corta en el primer fallo: si un plane es rechazado no se esperan
+        los timeouts (hasta 10s) de los que siguen en vuelo, y se
+        desconectan todos los planes (ver _abort_connections).
+
+        Returns:
+            bool: True si todos los planes conectaron
+        """
+        pending = {future: (component, plane) for component, plane, future in connections}
+        for future in as_completed(pending):
+            if future.result():
+                continue
+            component, plane = pending[future]
+            log_error_with_context(
+                logger,
+                message=(
+                    "❌ No se pudo conectar Data Plane" if component == "data_plane"
+                    else "❌ No se pudo conectar Control Plane"
+                ),
+                component="controller",
+                event=f"{component}_connection_failed",
+                broker_host=self.config.MQTT_BROKER,
+                broker_port=self.config.MQTT_PORT,
+                client_id=plane.client_id,
+            )
+            self._abort_connections(connections)
+            return False
+        return True
+
+    def _abort_connections(self, connections) -> None:
+        """
+        Desconecta todos los planes lanzados en setup() tras un fallo.
+
+        Cada connect() deja corriendo el network loop de paho (aunque falle
+        por timeout). Los que siguen en vuelo se desconectan al terminar
+        (done callback), sin esperar sus timeouts.
+        """
+        for component, plane, future in connections:
+            def disconnect(_, component=component, plane=plane):
+                self._disconnect_plane(component, plane)
+
+            future.add_done_callback(disconnect)
+
+    @staticmethod
+    def _disconnect_plane(component: str, plane) -> None:
+        """Desconecta un plane tras un setup fallido (errores solo logueados)."""
+        try:
+            plane.disconnect()
+        except Exception as e:
+            log_error_with_context(
+                logger,
+                message="❌ Error desconectando plane tras setup fallido",
+                exception=e,
+                component="controller",
+                event=f"{component}_abort_disconnect_error",
+                client_id=plane.client_id,
+            )
+
     def _setup_control_callbacks(self):
         """
         Registra comandos en CommandRegistry del Control Plane.
 
-        Comandos condicionales basados en capabilities del handler.
+        Recorre _COMMAND_SPEC una vez; los comandos condicionales solo se
+        registran si su predicado (capabilities del handler) es True.
+        Cada handler se registra encolado (ver _enqueue_command/_cmd_loop):
+        lifecycle en la cola de comandos, consultas en la de queries.
+        Al final el registry se congela (freeze).
         """
         registry = self.control_plane.command_registry
 
-        # Comandos básicos (siempre disponibles)
-        registry.register('pause', self._handle_pause, "Pausa el procesamiento")
-        registry.register('resume', self._handle_resume, "Reanuda el procesamiento")
-        registry.register('stop', self._handle_stop, "Detiene y finaliza el pipeline")
-        registry.register('status', self._handle_status, "Consulta estado actual")
-        registry.register('metrics', self._handle_metrics, "Publica métricas del pipeline")
-        registry.register('health', self._handle_health_check, "Health check del sistema")
-
-        # Comando TOGGLE_CROP solo si handler soporta toggle
-        if self.inference_handler and self.inference_handler.supports_toggle:
-            registry.register('toggle_crop', self._handle_toggle_crop, "Toggle adaptive ROI crop")
-            logger.info("✅ toggle_crop command registered (handler supports toggle)")
-
-        # Comando STABILIZATION_STATS solo si stabilization habilitado
-        if self.stabilizer is not None:
-            registry.register('stabilization_stats', self._handle_stabilization_stats, "Estadísticas de estabilización")
-            logger.info("✅ stabilization_stats command registered")
+        for command, attr, description, is_query, available in self._COMMAND_SPEC:
+            if available is not None and not available(self):
+                continue
+
+            queue = self._query_queue if is_query else self._cmd_queue
+            registry.register(
+                command,
+                self._enqueue_command(getattr(self, attr), queue),
+                description,
+            )
+            if available is not None:
+                logger.info("✅ %s command registered", command)
+
+        # Set cerrado: no se registran comandos después del setup
+        registry.freeze()
+
+    def _enqueue_command(self, handler, queue: Optional[Queue] = None):
+        """
+        Envuelve un handler para que el thread de paho solo lo encole.
+
+        Cola acotada: si el worker está saturado, el comando se descarta
+        (con warning) en lugar de bloquear el thread de red.
+
+        Se encola junto con una copia del contexto (contextvars): el
+        handler corre en el worker con el trace_id que el Control Plane
+        abrió para el comando.
+
+        Args:
+            handler: Callback del comando
+            queue: Cola destino (default: _cmd_queue, lifecycle en orden)
+        """
+        if queue is None:
+            queue = self._cmd_queue
+
+        def enqueue():
+            try:
+                queue.put_nowait((handler, contextvars.copy_context()))
+            except Full:
+                logger.warning(
+                    "⚠️ Cola de comandos llena, comando descartado",
+                    extra={
+                        "component": "controller",
+                        "event": "command_dropped",
+                        "handler": handler.__name__,
+                        "queue_size": queue.maxsize,
+                    }
+                )
+
+        enqueue.__name__ = handler.__name__
+        return enqueue
+
+    def _cmd_loop(self, queue: Queue):
+        """
+        Worker: ejecuta handlers de la cola en orden de llegada (None = fin).
+
+        Cada handler corre dentro del contexto capturado al encolar.
+        """
+        while True:
+            item = queue.get()
+            if item is None:
+                return
+            handler, ctx = item
+            ctx.run(self._run_command, handler)
+
+    @staticmethod
+    def _run_command(handler):
+        """Ejecuta un handler de comando (errores logueados, no propagados)."""
+        try:
+            handler()
+        except Exception as e:
+            log_error_with_context(
+                logger,
+                message="❌ Error ejecutando comando",
+                exception=e,
+                component="controller",
+                event="command_handler_error",
+                handler=handler.__name__,
+            )
     
+    def _metrics_loop(self):
+        """
+        Worker: publica métricas del watchdog cada METRICS_INTERVAL_S.
+
+        Guarda el último snapshot publicado para el comando METRICS.
+        Termina con shutdown_event o al detenerse el pipeline. Log en DEBUG:
+        con el default (5s) serían 12 líneas INFO por minuto.
+        """
+        interval = self.config.METRICS_INTERVAL_S
+        while not self.shutdown_event.wait(interval):
+            if self._terminated.is_set():
+                return
+            snapshot = self.data_plane.publish_metrics(log_level=logging.DEBUG)
+            if snapshot is not None:
+                self._metrics_snapshot = snapshot
+
     def _status_update_handler(self, status: StatusUpdate):
         """Handler para status updates del pipeline"""
-        if status.severity.value >= UpdateSeverity.WARNING.value:
+        severity = status.severity
+        if severity not in _QUIET_SEVERITIES:
             logger.warning(
-                f"Pipeline Status: [{status.severity.name}] {status.event_type}"
+                "Pipeline Status: [%s] %s", severity.name, status.event_type
             )
     
     def _handle_stop(self):
         """Callback para comando STOP - detiene y finaliza el programa"""
         logger.info("⏹️ Comando STOP recibido")
-        if self.is_running:
+        if not self._terminated.is_set():
             try:
-                self.pipeline.terminate()
-                self.is_running = False
+                self._terminate_once()
                 logger.info("✅ Pipeline detenido")
             except Exception as e:
                 logger.error(
@@ -305,8 +637,9 @@ class InferencePipelineController:
                     }
                 )
 
-        # Publicar status
-        self.control_plane.publish_status("stopped")
+        # Publicar status (QoS 0: cleanup() publica "disconnected" retenido
+        # enseguida y lo reemplaza, no vale la pena el PUBACK)
+        self.control_plane.publish_status("stopped", qos=0)
 
         # Siempre setear shutdown_event para terminar el programa
         logger.info("🛑 Finalizando servicio...")
@@ -315,7 +648,7 @@ class InferencePipelineController:
     def _handle_pause(self):
         """Callback para comando PAUSE - pausa temporalmente el procesamiento"""
         logger.info("⏸️ Comando PAUSE recibido")
-        if self.is_running:
+        if not self._terminated.is_set():
             try:
                 self.pipeline.pause_stream()
                 self.control_plane.publish_status("paused")
@@ -337,7 +670,7 @@ class InferencePipelineController:
     def _handle_resume(self):
         """Callback para comando RESUME - reanuda después de PAUSE"""
         logger.info("▶️ Comando RESUME recibido")
-        if self.is_running:
+        if not self._terminated.is_set():
             try:
                 self.pipeline.resume_stream()
                 self.control_plane.publish_status("running")
@@ -359,14 +692,29 @@ class InferencePipelineController:
     def _handle_status(self):
         """Callback para comando STATUS - publica estado actual"""
         logger.info("📋 Comando STATUS recibido")
-        status = "running" if self.is_running else "stopped"
+        status = "stopped" if self._terminated.is_set() else "running"
         self.control_plane.publish_status(status)
 
     def _handle_metrics(self):
-        """Callback para comando METRICS - publica métricas del watchdog vía MQTT"""
+        """
+        Callback para comando METRICS - publica métricas del watchdog vía MQTT.
+
+        Re-publica el snapshot de _metrics_loop solo mientras ese worker lo
+        mantiene fresco; sin worker (metrics_interval_s: 0) o con el pipeline
+        terminado formatea en el momento, sin guardarlo.
+        """
         logger.info("📊 Comando METRICS recibido")
         try:
-            self.data_plane.publish_metrics()
+            worker = self._metrics_worker
+            if (
+                self._metrics_snapshot is not None
+                and worker is not None
+                and worker.is_alive()
+                and not self._terminated.is_set()
+            ):
+                self.data_plane.publish_metrics(self._metrics_snapshot)
+            else:
+                self.data_plane.publish_metrics()
         except Exception as e:
             logger.error(
                 "Failed to publish metrics",
@@ -390,8 +738,8 @@ class InferencePipelineController:
         # Validación: handler debe soportar toggle
         if not self.inference_handler.supports_toggle:
             logger.warning(
-                f"⚠️ Handler {self.inference_handler.__class__.__name__} "
-                f"no soporta toggle dinámico"
+                "⚠️ Handler %s no soporta toggle dinámico",
+                self.inference_handler.__class__.__name__,
             )
             return
 
@@ -405,7 +753,7 @@ class InferencePipelineController:
         """Callback para comando STABILIZATION_STATS - publica estadísticas de estabilización"""
         logger.info("📊 Comando STABILIZATION_STATS recibido")
 
-        if self.config.STABILIZATION_MODE == 'none':
+        if not self._is_stab_on:
             logger.warning("⚠️ Detection Stabilization no habilitado (mode='none')")
             logger.info("💡 Para habilitar, configurar detection_stabilization.mode en config.yaml")
             return
@@ -414,26 +762,29 @@ class InferencePipelineController:
             logger.warning("⚠️ Stabilizer no disponible")
             return
 
+        # Hot path si se piden stats a alta frecuencia: el reporte es solo
+        # un log, no armarlo si INFO está filtrado
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         try:
             # Obtener estadísticas del stabilizer
             stats = self.stabilizer.get_stats(source_id=0)
 
-            # Log estadísticas
-            logger.info("📈 Detection Stabilization Stats:")
-            logger.info(f"   Mode: {self.config.STABILIZATION_MODE}")
-            logger.info(f"   Total detected: {stats.get('total_detected', 0)}")
-            logger.info(f"   Total confirmed: {stats.get('total_confirmed', 0)}")
-            logger.info(f"   Total ignored: {stats.get('total_ignored', 0)}")
-            logger.info(f"   Total removed: {stats.get('total_removed', 0)}")
-            logger.info(f"   Active tracks: {stats.get('active_tracks', 0)}")
-            logger.info(f"   Confirm ratio: {stats.get('confirm_ratio', 0.0):.2%}")
+            # Log estadísticas (un solo record, template constante)
+            values = {**_STATS_DEFAULTS, **stats}
 
             # Breakdown por clase
-            tracks_by_class = stats.get('tracks_by_class', {})
-            if tracks_by_class:
-                logger.info("   Tracks by class:")
-                for class_name, count in tracks_by_class.items():
-                    logger.info(f"     - {class_name}: {count}")
+            by_class = "".join(
+                "\n     - %s: %s" % item for item in values['tracks_by_class'].items()
+            )
+
+            logger.info(_STATS_TEMPLATE % {
+                **values,
+                'mode': self.config.STABILIZATION_MODE,
+                'confirm_pct': values['confirm_ratio'] * 100,
+                'by_class': "\n   Tracks by class:" + by_class if by_class else "",
+            })
 
         except Exception as e:
             logger.error(
@@ -505,7 +856,8 @@ class InferencePipelineController:
             self.control_plane.publish_status(health_json)
 
             logger.info(
-                f"✅ Health check: {health['status']}",
+                "✅ Health check: %s",
+                health['status'],
                 extra={
                     "component": "controller",
                     "event": "health_check",
@@ -528,46 +880,137 @@ class InferencePipelineController:
 
     def run(self):
         """Ejecuta el pipeline"""
-        if not self.setup():
-            logger.error("❌ Setup falló")
-            return
-        
-        logger.info("\n" + "="*70)
-        logger.info("🎬 InferencePipeline con MQTT activo y corriendo")
-        logger.info("="*70)
-        logger.info(f"📡 Control Topic: {self.config.CONTROL_COMMAND_TOPIC}")
-        logger.info(f"📊 Data Topic: {self.config.DATA_TOPIC}")
-        logger.info(f"▶️  Estado: RUNNING")
-        logger.info("\n💡 Comandos MQTT disponibles:")
-        logger.info('   PAUSE:   {"command": "pause"}   - Pausa el procesamiento')
-        logger.info('   RESUME:  {"command": "resume"}  - Reanuda el procesamiento')
-        logger.info('   STOP:    {"command": "stop"}    - Detiene y finaliza')
-        logger.info('   STATUS:  {"command": "status"}  - Consulta estado actual')
-        logger.info('   METRICS: {"command": "metrics"} - Publica métricas del pipeline')
-        if self.config.ROI_MODE == 'adaptive':
-            logger.info('   TOGGLE_CROP: {"command": "toggle_crop"} - Toggle adaptive ROI crop (solo modo adaptive)')
-        if self.config.STABILIZATION_MODE != 'none':
-            logger.info('   STABILIZATION_STATS: {"command": "stabilization_stats"} - Estadísticas de detección estabilizada')
-        logger.info("\n⌨️  Presiona Ctrl+C para salir")
-        logger.info("="*70 + "\n")
-        
-        # Configurar signal handler
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # SIGINT/SIGTERM bloqueadas: main() ya lo hizo antes de crear
+        # cualquier thread; acá se asegura para quien llame run() directo.
+        # Todos los threads (paho, workers, pipeline) heredan la máscara y
+        # las señales las recibe solo _signal_waiter vía sigwait(). Sin
+        # pthread_sigmask (ej: Windows) queda el KeyboardInterrupt del Ctrl+C
+        previous_mask = None
+        waiter = None
+        if hasattr(signal, 'pthread_sigmask'):
+            previous_mask = signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+            waiter = Thread(
+                target=self._signal_waiter,
+                name="signal-waiter",
+                daemon=True,
+            )
+            waiter.start()
 
-        # Esperar a que se detenga (con timeout para evitar bloqueos)
         try:
-            while not self.shutdown_event.is_set():
-                self.shutdown_event.wait(timeout=1.0)
+            self._run_until_shutdown()
+        finally:
+            # Dejar el proceso como estaba: sin waiter que consuma señales
+            # y con la máscara previa (no-op si la bloqueó main())
+            if waiter is not None:
+                self._stop_signal_waiter(waiter)
+                signal.pthread_sigmask(signal.SIG_SETMASK, previous_mask)
+
+    def _run_until_shutdown(self):
+        """setup() → espera shutdown_event → cleanup() (ver run())."""
+        try:
+            setup_ok = self.setup()
+            # Bajo _signal_lock: una señal llega antes (KeyboardInterrupt
+            # inyectado, cae en el except de abajo) o después (solo setea
+            # shutdown_event), nunca en el medio
+            with self._signal_lock:
+                self._setup_done = True
+            if not setup_ok:
+                logger.error("❌ Setup falló")
+                return
+
+            logger.info(self._build_banner())
+
+            # Esperar a que se detenga: _signal_waiter y _handle_stop
+            # despiertan el wait() al setear shutdown_event
+            self.shutdown_event.wait()
         except KeyboardInterrupt:
             logger.info("\n\n⚠️ Interrupción forzada...")
             self.shutdown_event.set()
 
         # Cleanup
         self.cleanup()
-    
-    def _signal_handler(self, signum, frame):
-        """Handler para señales (Ctrl+C)"""
+
+    def _terminate_once(self, timeout: float = 10.0) -> bool:
+        """
+        Termina el pipeline y espera sus threads, una sola vez.
+
+        STOP (worker de comandos) y cleanup() (main thread) pueden llegar
+        ambos acá: el lock hace el check-and-set atómico y solo el primero
+        paga terminate() + join(); el resto retorna False sin bloquear.
+        """
+        with self._terminate_lock:
+            if self._terminated.is_set():
+                return False
+            self._terminated.set()
+
+        logger.info(
+            "🛑 Deteniendo pipeline",
+            extra={
+                "component": "controller",
+                "event": "pipeline_terminate",
+            }
+        )
+        self.pipeline.terminate()
+
+        logger.info(
+            "⏳ Esperando threads del pipeline (timeout %ss)",
+            timeout,
+            extra={
+                "component": "controller",
+                "event": "pipeline_join",
+                "timeout": timeout,
+            }
+        )
+        self.pipeline.join(timeout=timeout)
+        return True
+
+    def _build_banner(self) -> str:
+        """Banner de inicio (un solo string → un solo log record)."""
+        separator = "=" * 70
+        lines = ["", separator]
+        if self.config.MQTT_ENABLED:
+            lines += [
+                "🎬 InferencePipeline con MQTT activo y corriendo",
+                separator,
+                f"📡 Control Topic: {self.config.CONTROL_COMMAND_TOPIC}",
+                f"📊 Data Topic: {self.config.DATA_TOPIC}",
+            ]
+        else:
+            lines += [
+                "🎬 InferencePipeline corriendo (MQTT deshabilitado)",
+                separator,
+            ]
+        lines.append("▶️  Estado: RUNNING")
+        if self.config.MQTT_ENABLED:
+            lines += [
+                "",
+                "💡 Comandos MQTT disponibles:",
+                '   PAUSE:   {"command": "pause"}   - Pausa el procesamiento',
+                '   RESUME:  {"command": "resume"}  - Reanuda el procesamiento',
+                '   STOP:    {"command": "stop"}    - Detiene y finaliza',
+                '   STATUS:  {"command": "status"}  - Consulta estado actual',
+                '   METRICS: {"command": "metrics"} - Publica métricas del pipeline',
+            ]
+            if self._is_adaptive:
+                lines.append('   TOGGLE_CROP: {"command": "toggle_crop"} - Toggle adaptive ROI crop (solo modo adaptive)')
+            if self._is_stab_on:
+                lines.append('   STABILIZATION_STATS: {"command": "stabilization_stats"} - Estadísticas de detección estabilizada')
+        lines += ["", "⌨️  Presiona Ctrl+C para salir", separator, ""]
+        return "\n".join(lines)
+
+    def _on_shutdown_signal(self, signum):
+        """
+        Pide el shutdown por SIGINT/SIGTERM (corre en _signal_waiter).
+
+        Solo despierta a run(): el shutdown tiene un único camino (run() →
+        cleanup() en el main thread), igual que el comando STOP.
+
+        Durante setup() (carga de modelo, conexiones) el main thread todavía
+        no espera shutdown_event: se le inyecta KeyboardInterrupt con
+        interrupt_main(), que corre el handler default de SIGINT. Si el
+        proceso arrancó con SIGINT ignorada (ej: `cmd &` desde un script)
+        no hay handler que correr: el shutdown arranca al terminar setup().
+        """
         logger.info(
             "\n\n⚠️ Señal de terminación recibida",
             extra={
@@ -577,27 +1020,34 @@ class InferencePipelineController:
             }
         )
         self.shutdown_event.set()
-        # Forzar terminación del pipeline inmediatamente
-        if self.pipeline and self.is_running:
-            logger.info(
-                "🛑 Deteniendo pipeline",
-                extra={
-                    "component": "controller",
-                    "event": "pipeline_stop_requested",
-                }
-            )
-            try:
-                self.pipeline.terminate()
-                self.is_running = False
-            except Exception as e:
-                log_error_with_context(
-                    logger,
-                    message="Error deteniendo pipeline",
-                    exception=e,
-                    component="controller",
-                    event="pipeline_stop_error",
-                )
-    
+        if not self._setup_done:
+            _thread.interrupt_main()
+
+    def _signal_waiter(self):
+        """
+        Worker: espera SIGINT/SIGTERM con sigwait() y pide el shutdown.
+
+        Retorna solo al ver _signal_waiter_done (ver _stop_signal_waiter).
+        """
+        while True:
+            signum = signal.sigwait(_SHUTDOWN_SIGNALS)
+            with self._signal_lock:
+                if self._signal_waiter_done:
+                    return
+                self._on_shutdown_signal(signum)
+
+    def _stop_signal_waiter(self, waiter: Thread):
+        """
+        Despierta al signal-waiter con un SIGTERM dirigido a su thread.
+
+        Bajo _signal_lock: el waiter solo retorna tras ver el flag, así que
+        sigue vivo cuando le llega el pthread_kill.
+        """
+        with self._signal_lock:
+            self._signal_waiter_done = True
+            signal.pthread_kill(waiter.ident, signal.SIGTERM)
+        waiter.join(timeout=1.0)
+
     def cleanup(self):
         """
         Limpia recursos al finalizar (mejorado).
@@ -616,35 +1066,16 @@ class InferencePipelineController:
         )
 
         # 1. Terminar pipeline si está corriendo
-        if self.pipeline and self.is_running:
+        if self.pipeline and not self._terminated.is_set():
             try:
-                logger.info(
-                    "🛑 Deteniendo pipeline",
-                    extra={
-                        "component": "controller",
-                        "event": "pipeline_terminate",
-                    }
-                )
-                self.pipeline.terminate()
-                self.is_running = False
-
-                # Esperar con timeout más largo (10s en lugar de 3s)
-                logger.info(
-                    "⏳ Esperando threads del pipeline (timeout 10s)",
-                    extra={
-                        "component": "controller",
-                        "event": "pipeline_join",
-                        "timeout": 10.0,
-                    }
-                )
-                self.pipeline.join(timeout=10.0)
-                logger.info(
-                    "✅ Pipeline detenido",
-                    extra={
-                        "component": "controller",
-                        "event": "pipeline_stopped",
-                    }
-                )
+                if self._terminate_once():
+                    logger.info(
+                        "✅ Pipeline detenido",
+                        extra={
+                            "component": "controller",
+                            "event": "pipeline_stopped",
+                        }
+                    )
 
             except Exception as e:
                 log_error_with_context(
@@ -655,44 +1086,99 @@ class InferencePipelineController:
                     event="pipeline_terminate_error",
                 )
 
-        # 2. Desconectar Control Plane
-        if self.control_plane:
-            try:
-                self.control_plane.disconnect()
-                logger.info(
-                    "✅ Control Plane desconectado",
-                    extra={
-                        "component": "controller",
-                        "event": "control_plane_disconnected",
-                    }
-                )
-            except Exception as e:
-                log_error_with_context(
-                    logger,
-                    message="❌ Error desconectando Control Plane",
-                    exception=e,
-                    component="controller",
-                    event="control_plane_disconnect_error",
-                )
+        # Detener workers de comandos (ya no llegan más comandos)
+        if self._cmd_workers:
+            self._cmd_queue.put(None)
+            self._query_queue.put(None)
+
+        # 2. Desconectar Control Plane y Data Planes en paralelo: son
+        # conexiones independientes y cada disconnect espera su flush (ACKs
+        # QoS 1 en vuelo). Los Data Planes siguen en orden entre sí
+        disconnector = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix="mqtt-disconnect",
+        )
+        _, not_done = wait(
+            [
+                disconnector.submit(self._disconnect_control_plane),
+                disconnector.submit(self._disconnect_data_planes),
+            ],
+            timeout=_DISCONNECT_TIMEOUT_S,
+        )
+        disconnector.shutdown(wait=False)
+        if not_done:
+            logger.warning(
+                "⚠️ Timeout desconectando MQTT",
+                extra={
+                    "component": "controller",
+                    "event": "disconnect_timeout",
+                    "timeout_s": _DISCONNECT_TIMEOUT_S,
+                }
+            )
 
-        # 3. Desconectar Data Plane
-        if self.data_plane:
+        logger.info(
+            "👋 Hasta luego!",
+            extra={
+                "component": "controller",
+                "event": "cleanup_complete",
+            }
+        )
+        # Sin os._exit(0): threads propios son daemon (paho loop, sink MQTT,
+        # worker de comandos) y el intérprete termina normalmente.
+        # Escape hatch para threads de terceros colgados: pipeline.force_exit
+        if self.config.FORCE_EXIT:
+            logging.shutdown()
+            os._exit(0)
+
+    def _disconnect_control_plane(self):
+        """Desconecta el Control Plane (corre en el pool de cleanup)."""
+        if not self.control_plane:
+            return
+
+        try:
+            self.control_plane.disconnect()
+            logger.info(
+                "✅ Control Plane desconectado",
+                extra={
+                    "component": "controller",
+                    "event": "control_plane_disconnected",
+                }
+            )
+        except Exception as e:
+            log_error_with_context(
+                logger,
+                message="❌ Error desconectando Control Plane",
+                exception=e,
+                component="controller",
+                event="control_plane_disconnect_error",
+            )
+
+    def _disconnect_data_planes(self):
+        """
+        Desconecta los Data Planes en orden (corre en el pool de cleanup).
+
+        El principal primero: drena el sink MQTT asíncrono, que todavía
+        puede publicar por las otras conexiones del pool.
+        """
+        for plane in self.data_planes:
             try:
-                stats = self.data_plane.get_stats()
+                stats = plane.get_stats()
                 logger.info(
                     "📊 Data Plane stats",
                     extra={
                         "component": "controller",
                         "event": "data_plane_stats",
+                        "client_id": plane.client_id,
                         "stats": stats,
                     }
                 )
-                self.data_plane.disconnect()
+                plane.disconnect()
                 logger.info(
                     "✅ Data Plane desconectado",
                     extra={
                         "component": "controller",
                         "event": "data_plane_disconnected",
+                        "client_id": plane.client_id,
                     }
                 )
             except Exception as e:
@@ -702,23 +1188,21 @@ class InferencePipelineController:
                     exception=e,
                     component="controller",
                     event="data_plane_disconnect_error",
+                    client_id=plane.client_id,
                 )
 
-        logger.info(
-            "👋 Hasta luego!",
-            extra={
-                "component": "controller",
-                "event": "cleanup_complete",
-            }
-        )
-        # Eliminado os._exit(0) - dejamos que Python maneje cleanup normalmente
-
 
 # ============================================================================
 # MAIN
 # ============================================================================
 def main():
     """Punto de entrada principal"""
+    # SIGINT/SIGTERM bloqueadas antes de crear cualquier thread (logging,
+    # paho, pipeline): todos heredan la máscara y las atiende solo el
+    # signal-waiter de run() (una señal anterior queda pendiente para él)
+    if hasattr(signal, 'pthread_sigmask'):
+        signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+
     # Cargar configuración con validación Pydantic
     config_path = "config/adeline/config.yaml"
 
@@ -750,7 +1234,7 @@ def main():
     # Configurar structured logging (JSON)
     from ..logging import setup_logging
     setup_logging(
-        level=config.LOG_LEVEL,
+        level=config.LOG_LEVEL_NO,
         indent=config.JSON_INDENT,
         log_file=config.LOG_FILE,
         max_bytes=config.LOG_MAX_BYTES,
@@ -760,7 +1244,8 @@ def main():
     global logger
     logger = logging.getLogger(__name__)
     logger.info(
-        f"🔧 Adeline Inference Pipeline v{__version__} starting",
+        "🔧 Adeline Inference Pipeline v%s starting",
+        __version__,
         extra={
             "component": "controller",
             "event": "main_start",
@@ -770,7 +1255,7 @@ def main():
     )
 
     # Reducir verbosidad de paho-mqtt
-    logging.getLogger('paho').setLevel(getattr(logging, config.PAHO_LOG_LEVEL.upper()))
+    logging.getLogger('paho').setLevel(config.PAHO_LOG_LEVEL_NO)
 
     # Crear y ejecutar controller
     controller = InferencePipelineController(config)
@@ -13,28 +13,87 @@ Filosofía: "Complejidad por diseño"
 - Desacoplamiento sin plugin system completo
 - Evolutivo: registry crece si necesitamos más features
 """
-from functools import partial
-from typing import List, Callable, Optional, Any
+from itertools import cycle
+from typing import List, Callable, Optional, Any, Dict, Tuple
 import logging
 
 from ..sinks import SinkRegistry
+from ...data import BatchingMQTTSink, LeakyAsyncSink, create_mqtt_sink
+from ...inference.roi import roi_update_sink
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["SinkFactory"]
+
 
 # ============================================================================
 # Sink Factory Functions
 # ============================================================================
 
-def _create_mqtt_sink_factory(config: Any, data_plane: Any, **kwargs) -> Callable:
-    """Factory para MQTT sink (siempre presente)."""
-    from ...data import create_mqtt_sink
-    sink = create_mqtt_sink(data_plane)
+def _create_mqtt_sink_factory(
+    config: Any,
+    data_plane: Any,
+    data_planes: Optional[List[Any]] = None,
+    **kwargs
+) -> Callable:
+    """
+    Factory para MQTT sink (presente salvo con MQTT_ENABLED = False).
+
+    Con data_planes (pool, DATA_PLANE_POOL_SIZE > 1) se crea un sink por
+    conexión y las publicaciones se reparten round-robin. MQTT solo ordena
+    mensajes dentro de una conexión: con pool, frames consecutivos pueden
+    llegar desordenados al subscriber (reordenar por frame_id/timestamp).
+
+    Batching si MQTT_BATCH_SIZE > 1 (con cualquier QoS: también amortiza
+    headers MQTT y writes TCP; con QoS >= 1 además los PUBACK).
+
+    Con MQTT_ASYNC_SINK (opt-in) el sink se envuelve en LeakyAsyncSink:
+    publica en un worker y descarta la predicción más vieja si el broker
+    se atrasa. Por defecto se publica inline (paho solo encola).
+    """
+    if not config.MQTT_ENABLED:
+        return None  # Skip (modo offline)
+
+    batching = config.MQTT_BATCH_SIZE > 1
+
+    planes = data_planes or [data_plane]
+
+    if batching:
+        plane_sinks = [
+            BatchingMQTTSink(
+                plane,
+                max_batch=config.MQTT_BATCH_SIZE,
+                max_delay_ms=config.MQTT_BATCH_MS,
+            )
+            for plane in planes
+        ]
+    else:
+        plane_sinks = [create_mqtt_sink(plane) for plane in planes]
+
+    if len(plane_sinks) == 1:
+        sink = plane_sinks[0]
+    else:
+        next_sink = cycle(plane_sinks).__next__
+
+        def sink(predictions, video_frame=None):
+            next_sink()(predictions, video_frame)
+
+        # Lo encuentra wrap_sinks_with_stabilization (igual que create_mqtt_sink)
+        sink.__name__ = 'mqtt_sink'
+
+    if config.MQTT_ASYNC_SINK:
+        sink = LeakyAsyncSink(sink, data_plane)
+
     logger.info(
         "MQTT sink created",
         extra={
             "component": "sink_factory",
             "event": "mqtt_sink_created",
+            "batching": batching,
+            "pool_size": len(plane_sinks),
+            "async_sink": config.MQTT_ASYNC_SINK,
+            "batch_size": config.MQTT_BATCH_SIZE,
+            "batch_max_delay_ms": config.MQTT_BATCH_MS,
         }
     )
     return sink
@@ -45,8 +104,9 @@ def _create_roi_update_sink_factory(config: Any, roi_state: Any, **kwargs) -> Op
     if config.ROI_MODE != 'adaptive' or roi_state is None:
         return None  # Skip
 
-    from ...inference.roi import roi_update_sink
-    sink = partial(roi_update_sink, roi_state=roi_state)
+    # Closure con args posicionales (sin trampolín de partial ni kwargs por frame)
+    def sink(predictions, video_frame):
+        roi_update_sink(predictions, video_frame, roi_state)
     logger.info(
         "ROI update sink created",
         extra={
@@ -90,6 +150,25 @@ def _create_visualization_sink_factory(config: Any, roi_state: Any, inference_ha
     return sink
 
 
+# Registry armado una vez al importar (create_sinks solo lo recorre)
+_REGISTRY = SinkRegistry()
+_REGISTRY.register(
+    name='mqtt',
+    factory=_create_mqtt_sink_factory,
+    priority=1  # Primero (stabilization wrappea este)
+)
+_REGISTRY.register(
+    name='roi_update',
+    factory=_create_roi_update_sink_factory,
+    priority=50  # Medio
+)
+_REGISTRY.register(
+    name='visualization',
+    factory=_create_visualization_sink_factory,
+    priority=100  # Último (más lento)
+)
+
+
 class SinkFactory:
     """
     Factory para crear sinks usando SinkRegistry.
@@ -100,7 +179,7 @@ class SinkFactory:
     - Priority explícito: MQTT(1) → ROI(50) → Viz(100)
 
     Returns:
-        Lista de callables para multi_sink()
+        (sinks, sink_index) - ver create_sinks()
     """
 
     @staticmethod
@@ -109,7 +188,8 @@ class SinkFactory:
         data_plane: Any,
         roi_state: Optional[Any] = None,
         inference_handler: Optional[Any] = None,
-    ) -> List[Callable]:
+        data_planes: Optional[List[Any]] = None,
+    ) -> Tuple[List[Callable], Dict[str, int]]:
         """
         Crea lista de sinks según configuración usando registry.
 
@@ -118,41 +198,23 @@ class SinkFactory:
             data_plane: MQTTDataPlane para publicar
             roi_state: ROIState | FixedROIState | None
             inference_handler: BaseInferenceHandler | None
+            data_planes: Pool de MQTTDataPlane (incluye data_plane) | None
 
         Returns:
-            Lista de sinks para multi_sink()
+            (sinks, sink_index)
+                - sinks: Lista de sinks para on_prediction
+                - sink_index: Dict[nombre, posición] ('mqtt', 'roi_update',
+                  'visualization'; solo los sinks creados)
 
         Note:
-            Usa SinkRegistry internamente para desacoplamiento.
+            Usa el SinkRegistry de módulo (_REGISTRY) para desacoplamiento.
             Factory functions retornan None si sink no aplica.
         """
-        # Crear registry y registrar sinks con priority
-        registry = SinkRegistry()
-
-        registry.register(
-            name='mqtt',
-            factory=_create_mqtt_sink_factory,
-            priority=1  # Primero (stabilization wrappea este)
-        )
-
-        registry.register(
-            name='roi_update',
-            factory=_create_roi_update_sink_factory,
-            priority=50  # Medio
-        )
-
-        registry.register(
-            name='visualization',
-            factory=_create_visualization_sink_factory,
-            priority=100  # Último (más lento)
-        )
-
         # Crear todos los sinks
-        sinks = registry.create_all(
+        return _REGISTRY.create_indexed(
             config=config,
             data_plane=data_plane,
             roi_state=roi_state,
             inference_handler=inference_handler,
+            data_planes=data_planes,
         )
-
-        return sinks
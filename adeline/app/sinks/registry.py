@@ -13,11 +13,16 @@ Filosofía: "Complejidad por diseño"
 - ~50 líneas, no plugin system completo
 - Evolutivo: crece si necesitamos más features
 """
-from typing import List, Callable, Optional, Any, Dict
+from bisect import insort
+from operator import itemgetter
+from typing import List, Callable, Optional, Any, Dict, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Clave de orden de las entradas (name, factory, priority)
+_BY_PRIORITY = itemgetter(2)
+
 
 class SinkRegistry:
     """
@@ -39,7 +44,10 @@ class SinkRegistry:
 
     def __init__(self):
         """Inicializa registry vacío."""
+        # Ordenado por priority al registrar; _ordered es el snapshot
+        # inmutable que recorren create_* (sin sort ni copia por llamada)
         self._factories: List[tuple[str, Callable, int]] = []
+        self._ordered: Tuple[tuple[str, Callable, int], ...] = ()
 
     def register(
         self,
@@ -62,20 +70,24 @@ class SinkRegistry:
             ...     return create_mqtt_sink(data_plane)
             >>> registry.register('mqtt', mqtt_factory, priority=1)
         """
-        self._factories.append((name, factory, priority))
-        logger.debug(
-            "Sink registered",
-            extra={
-                "component": "sink_registry",
-                "event": "sink_registered",
-                "sink_name": name,
-                "priority": priority
-            }
-        )
+        # insort estable: con igual priority se respeta el orden de registro
+        insort(self._factories, (name, factory, priority), key=_BY_PRIORITY)
+        self._ordered = tuple(self._factories)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sink registered",
+                extra={
+                    "component": "sink_registry",
+                    "event": "sink_registered",
+                    "sink_name": name,
+                    "priority": priority
+                }
+            )
 
     def create_all(
         self,
         config,
+        strict: bool = True,
         **kwargs
     ) -> List[Callable]:
         """
@@ -83,6 +95,7 @@ class SinkRegistry:
 
         Args:
             config: PipelineConfig
+            strict: Ver create_indexed()
             **kwargs: Args para factories (data_plane, roi_state, etc.)
 
         Returns:
@@ -91,38 +104,69 @@ class SinkRegistry:
         Note:
             Si factory retorna None, el sink se skippea.
         """
-        sinks = []
+        sinks, _ = self.create_indexed(config, strict=strict, **kwargs)
+        return sinks
 
-        # Ordenar por priority
-        sorted_factories = sorted(self._factories, key=lambda x: x[2])
+    def create_indexed(
+        self,
+        config,
+        strict: bool = True,
+        **kwargs
+    ) -> Tuple[List[Callable], Dict[str, int]]:
+        """
+        Igual que create_all(), pero también retorna el índice de cada sink.
+
+        Args:
+            config: PipelineConfig
+            strict: Si una factory falla:
+                - True (default): cierra los sinks ya creados (close(), si
+                  lo tienen: workers, conexiones) y re-lanza la excepción
+                - False: loggea, skippea ese sink y sigue con el resto
+            **kwargs: Args para factories (data_plane, roi_state, etc.)
 
-        # Crear sinks
-        for name, factory, priority in sorted_factories:
+        Returns:
+            (sinks, sink_index)
+                - sinks: Lista de sinks ordenados por priority
+                - sink_index: Dict[nombre registrado, posición en sinks]
+                  (solo sinks creados, los skippeados no aparecen)
+        """
+        sinks = []
+        sink_index: Dict[str, int] = {}
+        # Nivel resuelto una vez por llamada: los extra={} de debug/info
+        # solo se arman si el record se va a emitir
+        debug = logger.isEnabledFor(logging.DEBUG)
+        info = logger.isEnabledFor(logging.INFO)
+
+        # Crear sinks (_ordered ya está ordenado por priority)
+        for name, factory, priority in self._ordered:
             try:
                 sink = factory(config=config, **kwargs)
 
                 # Si factory retorna None, skip
                 if sink is None:
-                    logger.debug(
-                        "Sink skipped",
+                    if debug:
+                        logger.debug(
+                            "Sink skipped",
+                            extra={
+                                "component": "sink_registry",
+                                "event": "sink_skipped",
+                                "sink_name": name
+                            }
+                        )
+                    continue
+
+                sink_index[name] = len(sinks)
+                sinks.append(sink)
+                if info:
+                    logger.info(
+                        "Sink created",
                         extra={
                             "component": "sink_registry",
-                            "event": "sink_skipped",
-                            "sink_name": name
+                            "event": "sink_created",
+                            "sink_name": name,
+                            "priority": priority
                         }
                     )
-                    continue
-
-                sinks.append(sink)
-                logger.info(
-                    "Sink created",
-                    extra={
-                        "component": "sink_registry",
-                        "event": "sink_created",
-                        "sink_name": name,
-                        "priority": priority
-                    }
-                )
 
             except Exception as e:
                 logger.error(
@@ -131,10 +175,13 @@ class SinkRegistry:
                         "component": "sink_registry",
                         "event": "sink_creation_failed",
                         "sink_name": name,
-                        "error": str(e)
+                        "error": str(e),
+                        "strict": strict,
                     }
                 )
-                raise
+                if strict:
+                    self._close_sinks(sinks)
+                    raise
 
         logger.info(
             "Sinks creation complete",
@@ -144,4 +191,23 @@ class SinkRegistry:
                 "total_sinks": len(sinks)
             }
         )
-        return sinks
+        return sinks, sink_index
+
+    @staticmethod
+    def _close_sinks(sinks: List[Callable]) -> None:
+        """Cierra (en orden inverso) los sinks creados que exponen close()."""
+        for sink in reversed(sinks):
+            close = getattr(sink, 'close', None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.warning(
+                    "Error closing sink",
+                    extra={
+                        "component": "sink_registry",
+                        "event": "sink_close_failed",
+                        "error": str(e)
+                    }
+                )
@@ -12,6 +12,8 @@ Usage (Legacy - Backward compatibility):
     from config import PipelineConfig
     config = PipelineConfig()
 """
+from typing import TYPE_CHECKING, Any
+
 from .schemas import (
     AdelineConfig,
     PipelineSettings,
@@ -22,8 +24,11 @@ from .schemas import (
     LoggingSettings,
 )
 
-# Legacy imports for backward compatibility
-from ..legacy_config import PipelineConfig, disable_models_from_config
+# Legacy imports for backward compatibility (lazy, ver __getattr__)
+if TYPE_CHECKING:
+    from ..legacy_config import PipelineConfig, disable_models_from_config
+
+_LEGACY_EXPORTS = frozenset({'PipelineConfig', 'disable_models_from_config'})
 
 __all__ = [
     # New Pydantic models
@@ -38,3 +43,19 @@ __all__ = [
     'PipelineConfig',
     'disable_models_from_config',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Re-export lazy de la config legacy (PEP 562).
+
+    legacy_config carga .env al importarse (load_dotenv); solo se importa
+    cuando alguien pide PipelineConfig/disable_models_from_config, no al
+    usar únicamente los schemas Pydantic.
+    """
+    if name in _LEGACY_EXPORTS:
+        from .. import legacy_config
+        value = getattr(legacy_config, name)
+        globals()[name] = value  # Próximos accesos sin pasar por acá
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,11 +14,17 @@ Usage:
     config = AdelineConfig.from_yaml("config/adeline/config.yaml")
     # Config ya está validado, tipos garantizados
 """
-from typing import Literal, Optional, List
+from typing import Literal, Optional, List, Tuple
 from pathlib import Path
 from pydantic import BaseModel, Field, field_validator, model_validator
-from pydantic_settings import BaseSettings
+import json
+import logging
 import os
+import yaml
+
+# Parser C (libyaml) si está disponible. Se le pasan los bytes del archivo
+# (una lectura, decodificación UTF-8 dentro de libyaml)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 # ============================================================================
@@ -49,6 +55,26 @@ class PipelineSettings(BaseModel):
         default=True,
         description="Display statistics in visualization"
     )
+    force_exit: bool = Field(
+        default=False,
+        description="Hard-exit (os._exit) after cleanup if a third-party thread hangs shutdown"
+    )
+    io_cpus: Optional[List[int]] = Field(
+        default=None,
+        description="CPU cores for MQTT I/O threads (Linux only, None = no pinning)"
+    )
+    inference_cpus: Optional[List[int]] = Field(
+        default=None,
+        description="CPU cores for inference pipeline threads (Linux only, None = no pinning)"
+    )
+
+    @field_validator('io_cpus', 'inference_cpus')
+    @classmethod
+    def validate_cpus(cls, v: Optional[List[int]]) -> Optional[List[int]]:
+        """CPU list must be non-empty, with non-negative core ids"""
+        if v is not None and (not v or min(v) < 0):
+            raise ValueError(f"CPU list must be non-empty with core ids >= 0, got {v}")
+        return v
 
 
 class ModelsSettings(BaseModel):
@@ -65,6 +91,7 @@ class ModelsSettings(BaseModel):
         default=320,
         ge=64,
         le=1280,
+        multiple_of=32,  # Requisito YOLO (constraint nativo, sin validator Python)
         description="Model input size (must be multiple of 32)"
     )
     confidence: float = Field(
@@ -80,14 +107,6 @@ class ModelsSettings(BaseModel):
         description="IoU threshold for NMS"
     )
 
-    @field_validator('imgsz')
-    @classmethod
-    def validate_imgsz_multiple_of_32(cls, v: int) -> int:
-        """Validate that imgsz is multiple of 32 (YOLO requirement)"""
-        if v % 32 != 0:
-            raise ValueError(f"imgsz must be multiple of 32, got {v}")
-        return v
-
 
 # ============================================================================
 # MQTT Configuration
@@ -145,13 +164,61 @@ class MQTTQoSSettings(BaseModel):
         default=0,
         description="Data plane QoS (recommended: 0 for performance)"
     )
+    metrics: Literal[0, 1, 2] = Field(
+        default=0,
+        description="Metrics topic QoS (0: periodic telemetry, a lost sample is fine)"
+    )
+
+
+class MQTTBatchingSettings(BaseModel):
+    """Data plane publish batching (coalesce N detections per MQTT message)"""
+    size: int = Field(
+        default=1,
+        ge=1,
+        le=256,
+        description="Max predictions per MQTT message (1 = no batching)"
+    )
+    max_delay_ms: int = Field(
+        default=50,
+        ge=1,
+        le=5000,
+        description="Max time a prediction waits in the batch before flush"
+    )
 
 
 class MQTTSettings(BaseModel):
     """Complete MQTT configuration"""
+    enabled: bool = Field(
+        default=True,
+        description="Enable MQTT data/control planes (false = offline/benchmark mode)"
+    )
     broker: MQTTBrokerSettings = Field(default_factory=MQTTBrokerSettings)
     topics: MQTTTopicsSettings = Field(default_factory=MQTTTopicsSettings)
     qos: MQTTQoSSettings = Field(default_factory=MQTTQoSSettings)
+    batching: MQTTBatchingSettings = Field(default_factory=MQTTBatchingSettings)
+    data_pool_size: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description=(
+            "MQTT client connections for inference publishes (round-robin). "
+            "MQTT only orders messages within one connection: with >1, "
+            "subscribers may receive consecutive frames out of order "
+            "(reorder by frame.frame_id / timestamp)"
+        )
+    )
+    async_sink: bool = Field(
+        default=False,
+        description=(
+            "Publish detections from a worker thread through a 1-slot "
+            "drop-oldest queue (bounded latency; drops frames if the broker lags)"
+        )
+    )
+    metrics_interval_s: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Periodic watchdog metrics publish interval (0 = only on METRICS command)"
+    )
 
 
 # ============================================================================
@@ -371,30 +438,45 @@ class LoggingSettings(BaseModel):
         description="Number of backup log files to keep"
     )
 
+    @property
+    def level_no(self) -> int:
+        """Nivel numérico de level (resuelto una vez, en to_legacy_config)"""
+        return logging.getLevelNamesMapping()[self.level]
+
+    @property
+    def paho_level_no(self) -> int:
+        """Nivel numérico de paho_level"""
+        return logging.getLevelNamesMapping()[self.paho_level]
+
 
 # ============================================================================
 # Models Disabled Configuration
 # ============================================================================
 
+# Default de models_disabled.disabled (literal armado una vez; el factory
+# solo copia la tupla)
+_DEFAULT_DISABLED_MODELS: Tuple[str, ...] = (
+    "PALIGEMMA",
+    "FLORENCE2",
+    "QWEN_2_5",
+    "CORE_MODEL_SAM",
+    "CORE_MODEL_SAM2",
+    "CORE_MODEL_CLIP",
+    "CORE_MODEL_GAZE",
+    "SMOLVLM2",
+    "DEPTH_ESTIMATION",
+    "MOONDREAM2",
+    "CORE_MODEL_TROCR",
+    "CORE_MODEL_GROUNDINGDINO",
+    "CORE_MODEL_YOLO_WORLD",
+    "CORE_MODEL_PE",
+)
+
+
 class ModelsDisabledSettings(BaseModel):
     """Models to disable (prevent ModelDependencyMissing warnings)"""
     disabled: List[str] = Field(
-        default_factory=lambda: [
-            "PALIGEMMA",
-            "FLORENCE2",
-            "QWEN_2_5",
-            "CORE_MODEL_SAM",
-            "CORE_MODEL_SAM2",
-            "CORE_MODEL_CLIP",
-            "CORE_MODEL_GAZE",
-            "SMOLVLM2",
-            "DEPTH_ESTIMATION",
-            "MOONDREAM2",
-            "CORE_MODEL_TROCR",
-            "CORE_MODEL_GROUNDINGDINO",
-            "CORE_MODEL_YOLO_WORLD",
-            "CORE_MODEL_PE",
-        ],
+        default_factory=lambda: list(_DEFAULT_DISABLED_MODELS),
         description="List of models to disable"
     )
 
@@ -427,8 +509,11 @@ class AdelineConfig(BaseModel):
         """
         Load and validate configuration from YAML file.
 
+        A `.json` file (same structure) is also accepted and parsed with
+        the json module, which is faster than any YAML loader.
+
         Args:
-            config_path: Path to config.yaml
+            config_path: Path to config.yaml (or config.json)
 
         Returns:
             Validated AdelineConfig instance
@@ -440,9 +525,12 @@ class AdelineConfig(BaseModel):
         Example:
             config = AdelineConfig.from_yaml("config/adeline/config.yaml")
             print(config.pipeline.max_fps)  # Type-safe access
-        """
-        import yaml
 
+        Note:
+            Every call runs full validation (no model_construct shortcut):
+            config is loaded once per process, and the validators are what
+            keep an edited file from starting the pipeline with bad values.
+        """
         config_file = Path(config_path)
         if not config_file.exists():
             raise FileNotFoundError(
@@ -450,15 +538,21 @@ class AdelineConfig(BaseModel):
                 f"Please create it from config/adeline/config.yaml.example"
             )
 
-        with open(config_file, 'r') as f:
-            config_dict = yaml.safe_load(f)
+        data = config_file.read_bytes()
+        if config_file.suffix == '.json':
+            config_dict = json.loads(data)
+        else:
+            config_dict = yaml.load(data, Loader=_YAML_LOADER)
 
         # Override sensitive data from environment variables
-        if 'mqtt' in config_dict and 'broker' in config_dict['mqtt']:
-            if os.getenv('MQTT_USERNAME'):
-                config_dict['mqtt']['broker']['username'] = os.getenv('MQTT_USERNAME')
-            if os.getenv('MQTT_PASSWORD'):
-                config_dict['mqtt']['broker']['password'] = os.getenv('MQTT_PASSWORD')
+        username = os.environ.get('MQTT_USERNAME')
+        password = os.environ.get('MQTT_PASSWORD')
+        if username or password:
+            broker = config_dict.setdefault('mqtt', {}).setdefault('broker', {})
+            if username:
+                broker['username'] = username
+            if password:
+                broker['password'] = password
 
         # Validate and return
         return cls(**config_dict)
@@ -474,73 +568,100 @@ class AdelineConfig(BaseModel):
         """
         from ..legacy_config import PipelineConfig
 
-        # Create legacy config manually (bypass __init__ validation)
+        # Secciones ya validadas (aliases locales para el mapeo)
+        pipeline = self.pipeline
+        models = self.models
+        mqtt = self.mqtt
+        broker, topics, qos = mqtt.broker, mqtt.topics, mqtt.qos
+        log = self.logging
+        stab = self.detection_stabilization
+        roi = self.roi_strategy
+        adaptive, fixed = roi.adaptive, roi.fixed
+
+        # Create legacy config manually (bypass __init__ validation):
+        # un solo update del __dict__ con el mapeo completo
         legacy = object.__new__(PipelineConfig)
-
-        # Pipeline
-        legacy.RTSP_URL = self.pipeline.rtsp_url
-        legacy.MODEL_ID = self.pipeline.model_id
-        legacy.MAX_FPS = self.pipeline.max_fps
-        legacy.ENABLE_VISUALIZATION = self.pipeline.enable_visualization
-        legacy.DISPLAY_STATISTICS = self.pipeline.display_statistics
-
-        # Models
-        legacy.USE_LOCAL_MODEL = self.models.use_local
-        legacy.LOCAL_MODEL_PATH = self.models.local_path
-        legacy.MODEL_IMGSZ = self.models.imgsz
-        legacy.MODEL_CONFIDENCE = self.models.confidence
-        legacy.MODEL_IOU_THRESHOLD = self.models.iou_threshold
-
-        # API Key (from env, only needed for Roboflow)
-        legacy.API_KEY = os.getenv('ROBOFLOW_API_KEY')
-
-        # MQTT Broker
-        legacy.MQTT_BROKER = self.mqtt.broker.host
-        legacy.MQTT_PORT = self.mqtt.broker.port
-        legacy.MQTT_USERNAME = self.mqtt.broker.username
-        legacy.MQTT_PASSWORD = self.mqtt.broker.password
-
-        # MQTT Topics
-        legacy.CONTROL_COMMAND_TOPIC = self.mqtt.topics.control_commands
-        legacy.CONTROL_STATUS_TOPIC = self.mqtt.topics.control_status
-        legacy.DATA_TOPIC = self.mqtt.topics.data
-        legacy.METRICS_TOPIC = self.mqtt.topics.metrics
-
-        # MQTT QoS
-        legacy.CONTROL_QOS = self.mqtt.qos.control
-        legacy.DATA_QOS = self.mqtt.qos.data
-
-        # Logging
-        legacy.LOG_LEVEL = self.logging.level
-        legacy.LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'  # DEPRECATED
-        legacy.JSON_INDENT = self.logging.json_indent
-        legacy.PAHO_LOG_LEVEL = self.logging.paho_level
-        legacy.LOG_FILE = self.logging.file
-        legacy.LOG_MAX_BYTES = self.logging.max_bytes
-        legacy.LOG_BACKUP_COUNT = self.logging.backup_count
-
-        # Stabilization
-        legacy.STABILIZATION_MODE = self.detection_stabilization.mode
-        legacy.STABILIZATION_MIN_FRAMES = self.detection_stabilization.temporal.min_frames
-        legacy.STABILIZATION_MAX_GAP = self.detection_stabilization.temporal.max_gap
-        legacy.STABILIZATION_APPEAR_CONF = self.detection_stabilization.hysteresis.appear_confidence
-        legacy.STABILIZATION_PERSIST_CONF = self.detection_stabilization.hysteresis.persist_confidence
-        legacy.STABILIZATION_IOU_THRESHOLD = self.detection_stabilization.iou.threshold
-
-        # ROI Strategy
-        legacy.ROI_MODE = self.roi_strategy.mode
-        legacy.CROP_MARGIN = self.roi_strategy.adaptive.margin
-        legacy.CROP_SMOOTHING = self.roi_strategy.adaptive.smoothing
-        legacy.CROP_MIN_ROI_MULTIPLE = self.roi_strategy.adaptive.min_roi_multiple
-        legacy.CROP_MAX_ROI_MULTIPLE = self.roi_strategy.adaptive.max_roi_multiple
-        legacy.CROP_SHOW_STATISTICS = self.roi_strategy.adaptive.show_statistics
-        legacy.ADAPTIVE_RESIZE_TO_MODEL = self.roi_strategy.adaptive.resize_to_model
-
-        legacy.FIXED_X_MIN = self.roi_strategy.fixed.x_min
-        legacy.FIXED_Y_MIN = self.roi_strategy.fixed.y_min
-        legacy.FIXED_X_MAX = self.roi_strategy.fixed.x_max
-        legacy.FIXED_Y_MAX = self.roi_strategy.fixed.y_max
-        legacy.FIXED_SHOW_OVERLAY = self.roi_strategy.fixed.show_overlay
-        legacy.FIXED_RESIZE_TO_MODEL = self.roi_strategy.fixed.resize_to_model
+        legacy.__dict__.update({
+            # Pipeline
+            'RTSP_URL': pipeline.rtsp_url,
+            'MODEL_ID': pipeline.model_id,
+            'MAX_FPS': pipeline.max_fps,
+            'ENABLE_VISUALIZATION': pipeline.enable_visualization,
+            'DISPLAY_STATISTICS': pipeline.display_statistics,
+            'FORCE_EXIT': pipeline.force_exit,
+            'IO_CPUS': pipeline.io_cpus,
+            'INFERENCE_CPUS': pipeline.inference_cpus,
+
+            # Models
+            'USE_LOCAL_MODEL': models.use_local,
+            'LOCAL_MODEL_PATH': models.local_path,
+            'MODEL_IMGSZ': models.imgsz,
+            'MODEL_CONFIDENCE': models.confidence,
+            'MODEL_IOU_THRESHOLD': models.iou_threshold,
+
+            # API Key (from env, only needed for Roboflow)
+            'API_KEY': os.getenv('ROBOFLOW_API_KEY'),
+
+            # MQTT Broker
+            'MQTT_BROKER': broker.host,
+            'MQTT_PORT': broker.port,
+            'MQTT_USERNAME': broker.username,
+            'MQTT_PASSWORD': broker.password,
+
+            # MQTT Topics
+            'CONTROL_COMMAND_TOPIC': topics.control_commands,
+            'CONTROL_STATUS_TOPIC': topics.control_status,
+            'DATA_TOPIC': topics.data,
+            'METRICS_TOPIC': topics.metrics,
+
+            'MQTT_ENABLED': mqtt.enabled,
+
+            # MQTT QoS
+            'CONTROL_QOS': qos.control,
+            'DATA_QOS': qos.data,
+            'METRICS_QOS': qos.metrics,
+
+            # MQTT Batching (data plane)
+            'MQTT_BATCH_SIZE': mqtt.batching.size,
+            'MQTT_BATCH_MS': mqtt.batching.max_delay_ms,
+            'DATA_PLANE_POOL_SIZE': mqtt.data_pool_size,
+            'MQTT_ASYNC_SINK': mqtt.async_sink,
+            'METRICS_INTERVAL_S': mqtt.metrics_interval_s,
+
+            # Logging
+            'LOG_LEVEL': log.level,
+            'LOG_FORMAT': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # DEPRECATED
+            'JSON_INDENT': log.json_indent,
+            'PAHO_LOG_LEVEL': log.paho_level,
+            'LOG_LEVEL_NO': log.level_no,
+            'PAHO_LOG_LEVEL_NO': log.paho_level_no,
+            'LOG_FILE': log.file,
+            'LOG_MAX_BYTES': log.max_bytes,
+            'LOG_BACKUP_COUNT': log.backup_count,
+
+            # Stabilization
+            'STABILIZATION_MODE': stab.mode,
+            'STABILIZATION_MIN_FRAMES': stab.temporal.min_frames,
+            'STABILIZATION_MAX_GAP': stab.temporal.max_gap,
+            'STABILIZATION_APPEAR_CONF': stab.hysteresis.appear_confidence,
+            'STABILIZATION_PERSIST_CONF': stab.hysteresis.persist_confidence,
+            'STABILIZATION_IOU_THRESHOLD': stab.iou.threshold,
+
+            # ROI Strategy
+            'ROI_MODE': roi.mode,
+            'CROP_MARGIN': adaptive.margin,
+            'CROP_SMOOTHING': adaptive.smoothing,
+            'CROP_MIN_ROI_MULTIPLE': adaptive.min_roi_multiple,
+            'CROP_MAX_ROI_MULTIPLE': adaptive.max_roi_multiple,
+            'CROP_SHOW_STATISTICS': adaptive.show_statistics,
+            'ADAPTIVE_RESIZE_TO_MODEL': adaptive.resize_to_model,
+
+            'FIXED_X_MIN': fixed.x_min,
+            'FIXED_Y_MIN': fixed.y_min,
+            'FIXED_X_MAX': fixed.x_max,
+            'FIXED_Y_MAX': fixed.y_max,
+            'FIXED_SHOW_OVERLAY': fixed.show_overlay,
+            'FIXED_RESIZE_TO_MODEL': fixed.resize_to_model,
+        })
 
         return legacy
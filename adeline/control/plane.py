@@ -20,6 +20,7 @@ from typing import Optional
 import paho.mqtt.client as mqtt
 
 from .registry import CommandRegistry, CommandNotAvailableError
+from ..data.serialization import dumps, loads
 from ..logging import (
     trace_context,
     generate_trace_id,
@@ -29,6 +30,11 @@ from ..logging import (
 
 logger = logging.getLogger(__name__)
 
+# QoS por estado publicado: terminales con PUBACK (QoS 1); el resto
+# (connected, running, paused, respuestas de queries) QoS 0. Todos van
+# retenidos, así que un suscriptor nuevo igual recibe el último estado
+_STATUS_QOS = {"stopped": 1, "disconnected": 1, "error": 1}
+
 
 class MQTTControlPlane:
     """
@@ -89,7 +95,6 @@ class MQTTControlPlane:
         self.client.on_disconnect = self._on_disconnect
 
         self._connected = Event()
-        self._running = False  # Tracked for status updates
 
     def _on_connect(self, client, userdata, flags, rc, properties=None):
         """Callback cuando se conecta al broker"""
@@ -147,8 +152,7 @@ class MQTTControlPlane:
         Propaga trace_id para correlation en toda la call stack.
         """
         try:
-            payload = msg.payload.decode('utf-8')
-            command_data = json.loads(payload)
+            command_data = loads(msg.payload)
             command = command_data.get('command', '').lower()
 
             # Generar trace_id para este comando (permite seguir todo el flujo)
@@ -168,18 +172,20 @@ class MQTTControlPlane:
                 # Ejecutar comando vía registry
                 try:
                     self.command_registry.execute(command)
-                    logger.debug(
-                        f"✅ Comando '{command}' ejecutado correctamente",
-                        extra={"command": command, "trace_id": trace_id}
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "✅ Comando '%s' ejecutado correctamente", command,
+                            extra={"command": command, "trace_id": trace_id}
+                        )
 
                 except CommandNotAvailableError as e:
+                    # %s difiere el join de comandos disponibles al handler
                     logger.warning(
-                        f"⚠️ {e}",
+                        "⚠️ %s", e,
                         extra={
                             "command": command,
                             "trace_id": trace_id,
-                            "available_commands": sorted(self.command_registry.available_commands)
+                            "available_commands": e.available
                         }
                     )
 
@@ -202,22 +208,29 @@ class MQTTControlPlane:
                 mqtt_topic=msg.topic
             )
 
-    def publish_status(self, status: str):
+    def publish_status(self, status: str, qos: Optional[int] = None):
         """
         Publica el estado actual (público para uso desde handlers).
 
+        No bloquea: paho encola el mensaje y lo escribe el network loop
+        (no se espera el PUBACK).
+
         Args:
             status: Estado a publicar (ej: "paused", "running", "stopped")
+            qos: QoS del mensaje (default: según estado, ver _STATUS_QOS)
         """
+        if qos is None:
+            qos = _STATUS_QOS.get(status, 0)
+
         message = {
             "status": status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),  # ISO 8601 al serializar
             "client_id": self.client_id
         }
         self.client.publish(
             self.status_topic,
-            json.dumps(message),
-            qos=1,
+            dumps(message),
+            qos=qos,
             retain=True
         )
         logger.info(
@@ -263,5 +276,7 @@ class MQTTControlPlane:
         """Desconecta del broker MQTT"""
         logger.info("🔌 Desconectando Control Plane...")
         self.publish_status("disconnected")
-        self.client.loop_stop()
+        # disconnect() antes que loop_stop(): el network loop escribe lo
+        # encolado (status/flush) y el DISCONNECT, y recién ahí termina
         self.client.disconnect()
+        self.client.loop_stop()
@@ -14,15 +14,30 @@ Solución:
 - Validación temprana: error si comando no existe
 - Introspección: listar comandos disponibles
 """
-from typing import Callable, Dict, Set
+from typing import AbstractSet, Callable, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class CommandNotAvailableError(Exception):
-    """Comando no está disponible en el modo actual."""
-    pass
+    """
+    Comando no está disponible en el modo actual.
+
+    Guarda el comando y los disponibles; el mensaje se arma recién en
+    __str__ (solo si se loggea/imprime).
+    """
+
+    def __init__(self, command: str, available: Tuple[str, ...] = ()):
+        super().__init__(command, available)
+        self.command = command
+        self.available = available
+
+    def __str__(self) -> str:
+        return (
+            f"Command '{self.command}' not available. "
+            f"Available commands: {', '.join(self.available)}"
+        )
 
 
 class CommandRegistry:
@@ -45,6 +60,9 @@ class CommandRegistry:
         if handler.supports_toggle:
             registry.register('toggle_crop', handler.toggle, "Toggle ROI crop")
 
+        # Cerrar el set (opcional, al terminar el setup)
+        registry.freeze()
+
         # Ejecutar
         try:
             registry.execute('pause')
@@ -56,6 +74,9 @@ class CommandRegistry:
         """Inicializa registry vacío."""
         self._commands: Dict[str, Callable] = {}
         self._descriptions: Dict[str, str] = {}
+        self._frozen = False
+        # Comandos ordenados (mensajes de error/logs), se invalida en register()
+        self._sorted_cache: Optional[Tuple[str, ...]] = None
 
     def register(self, command: str, handler: Callable, description: str = ""):
         """
@@ -68,7 +89,15 @@ class CommandRegistry:
 
         Note:
             Si comando ya existe, se sobrescribe con warning.
+
+        Raises:
+            RuntimeError: Si el registry ya fue congelado (freeze)
         """
+        if self.frozen:
+            raise RuntimeError(
+                f"CommandRegistry frozen, cannot register '{command}'"
+            )
+
         if command in self._commands:
             logger.warning(
                 "Comando ya registrado, sobrescribiendo",
@@ -81,6 +110,7 @@ class CommandRegistry:
 
         self._commands[command] = handler
         self._descriptions[command] = description
+        self._sorted_cache = None
         logger.debug(
             "Comando registrado",
             extra={
@@ -104,14 +134,10 @@ class CommandRegistry:
         Raises:
             CommandNotAvailableError: Si comando no está registrado
         """
-        if command not in self._commands:
-            available = ', '.join(sorted(self.available_commands))
-            raise CommandNotAvailableError(
-                f"Command '{command}' not available. "
-                f"Available commands: {available}"
-            )
+        handler = self._commands.get(command)
+        if handler is None:
+            raise CommandNotAvailableError(command, self.available_sorted)
 
-        handler = self._commands[command]
         logger.debug(
             "Ejecutando comando",
             extra={
@@ -122,6 +148,32 @@ class CommandRegistry:
         )
         return handler()
 
+    def freeze(self):
+        """
+        Cierra el set de comandos (llamar al terminar de registrar).
+
+        Los comandos se conocen completos al final del setup: register()
+        pasa a fallar y available_sorted queda calculado. Idempotente.
+        """
+        if self._frozen:
+            return
+
+        self._frozen = True
+        self.available_sorted  # Precalcula el cache
+        logger.debug(
+            "Registry congelado",
+            extra={
+                "component": "command_registry",
+                "event": "registry_frozen",
+                "commands": len(self._commands),
+            }
+        )
+
+    @property
+    def frozen(self) -> bool:
+        """True si el registry ya no acepta comandos nuevos."""
+        return self._frozen
+
     def is_available(self, command: str) -> bool:
         """
         Verifica si comando está disponible.
@@ -135,14 +187,26 @@ class CommandRegistry:
         return command in self._commands
 
     @property
-    def available_commands(self) -> Set[str]:
+    def available_commands(self) -> AbstractSet[str]:
         """
         Set de comandos disponibles.
 
         Returns:
-            Set de nombres de comandos registrados
+            Vista (solo lectura, sin copia) de los comandos registrados
+        """
+        return self._commands.keys()
+
+    @property
+    def available_sorted(self) -> Tuple[str, ...]:
+        """
+        Comandos disponibles ordenados (cacheado hasta el próximo register).
+
+        Returns:
+            Tupla ordenada de nombres de comandos registrados
         """
-        return set(self._commands.keys())
+        if self._sorted_cache is None:
+            self._sorted_cache = tuple(sorted(self._commands))
+        return self._sorted_cache
 
     def get_help(self) -> Dict[str, str]:
         """
@@ -159,5 +223,5 @@ class CommandRegistry:
 
     def __repr__(self) -> str:
         """String representation para debugging."""
-        cmds = ', '.join(sorted(self.available_commands))
+        cmds = ', '.join(self.available_sorted)
         return f"CommandRegistry({len(self._commands)} commands: {cmds})"
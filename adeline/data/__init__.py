@@ -1,7 +1,7 @@
 """
 Data Plane - MQTT Data Publishing (QoS 0)
 """
-from .plane import MQTTDataPlane
-from .sinks import create_mqtt_sink
+from .plane import MQTTDataPlane, NullDataPlane
+from .sinks import create_mqtt_sink, BatchingMQTTSink, LeakyAsyncSink
 
-__all__ = ["MQTTDataPlane", "create_mqtt_sink"]
+__all__ = ["MQTTDataPlane", "NullDataPlane", "create_mqtt_sink", "BatchingMQTTSink", "LeakyAsyncSink"]
@@ -7,6 +7,8 @@ Usage:
 """
 import sys
 
+_MONITOR_TYPES = frozenset({"data", "status"})
+
 if __name__ == "__main__":
     monitor_type = sys.argv[1] if len(sys.argv) > 1 else "data"
 
@@ -16,7 +18,7 @@ if __name__ == "__main__":
         from .data_monitor import main
 
     # Remove monitor type from argv so the monitor's argparse works correctly
-    if len(sys.argv) > 1 and sys.argv[1] in ["data", "status"]:
+    if len(sys.argv) > 1 and sys.argv[1] in _MONITOR_TYPES:
         sys.argv.pop(1)
 
     main()
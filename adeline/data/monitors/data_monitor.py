@@ -16,10 +16,14 @@ import signal
 import sys
 from datetime import datetime
 from collections import defaultdict
-from threading import Lock
+from operator import itemgetter
+from queue import Empty, SimpleQueue
+from threading import Event, Lock, Thread
 
 import paho.mqtt.client as mqtt
 
+from ..serialization import loads
+
 
 class DataMonitor:
     """Monitor de detecciones del Data Plane"""
@@ -34,7 +38,13 @@ class DataMonitor:
         self.detection_count = 0
         self.class_counts = defaultdict(int)
         self.lock = Lock()
-        self.running = True
+        self.stop_event = Event()
+
+        # Salida a stdout desde un writer propio: el callback de paho solo
+        # encola texto y nunca espera a la terminal (None = fin)
+        self._out_q: SimpleQueue = SimpleQueue()
+        self._writer = Thread(target=self._writer_loop, name="monitor-writer", daemon=True)
+        self._writer.start()
         
         # Cliente MQTT
         self.client = mqtt.Client(
@@ -64,61 +74,89 @@ class DataMonitor:
     def _on_message(self, client, userdata, msg):
         """Callback cuando recibe un mensaje"""
         try:
-            payload = msg.payload.decode('utf-8')
-            data = json.loads(payload)
-            
+            data = loads(msg.payload)
+
+            # Batch (mqtt.batching.size > 1): {"batch_size": N, "messages": [...]}
+            messages = data['messages'] if 'messages' in data else [data]
+
+            # Lock solo para contadores: el print (stdout) va fuera de la
+            # sección crítica para no frenar el network loop de paho
+            to_print = []
             with self.lock:
-                self.message_count += 1
-                
-                # Extraer información
-                timestamp = data.get('timestamp', 'N/A')
-                detection_count = data.get('detection_count', 0)
-                detections = data.get('detections', [])
-                frame_info = data.get('frame', {})
-                
-                self.detection_count += detection_count
-                
-                # Contar clases
-                for det in detections:
-                    class_name = det.get('class', 'unknown')
-                    self.class_counts[class_name] += 1
-                
-                # Mostrar información
-                if self.verbose or detection_count > 0:
-                    self._print_message(timestamp, detection_count, detections, frame_info)
-                
+                for data in messages:
+                    self.message_count += 1
+
+                    # Extraer información
+                    timestamp = data.get('timestamp', 'N/A')
+                    detection_count = data.get('detection_count', 0)
+                    detections = data.get('detections', [])
+                    frame_info = data.get('frame', {})
+
+                    self.detection_count += detection_count
+
+                    # Contar clases
+                    for det in detections:
+                        class_name = det.get('class', 'unknown')
+                        self.class_counts[class_name] += 1
+
+                    if self.verbose or detection_count > 0:
+                        to_print.append((timestamp, detection_count, detections, frame_info))
+
+            # Mostrar información
+            for entry in to_print:
+                self._print_message(*entry)
+
         except json.JSONDecodeError:
             print(f"❌ Error decodificando JSON")
         except Exception as e:
             print(f"❌ Error procesando mensaje: {e}")
     
     def _print_message(self, timestamp, detection_count, detections, frame_info):
-        """Imprime información del mensaje"""
+        """Encola información del mensaje para el writer (un bloque por mensaje)"""
         now = datetime.now().strftime("%H:%M:%S")
-        
-        print(f"[{now}] 📦 Detecciones: {detection_count}")
-        
+
+        lines = [f"[{now}] 📦 Detecciones: {detection_count}"]
+
         if frame_info:
             frame_id = frame_info.get('frame_id', 'N/A')
             source_id = frame_info.get('source_id', 'N/A')
-            print(f"  📹 Frame: {frame_id} | Source: {source_id}")
-        
+            lines.append(f"  📹 Frame: {frame_id} | Source: {source_id}")
+
         if self.verbose and detections:
             for i, det in enumerate(detections, 1):
                 class_name = det.get('class', 'unknown')
                 confidence = det.get('confidence', 0.0)
                 bbox = det.get('bbox', {})
-                
-                print(f"  {i}. {class_name} ({confidence:.2%})", end="")
+
+                line = f"  {i}. {class_name} ({confidence:.2%})"
                 if bbox:
                     x = bbox.get('x', 0)
                     y = bbox.get('y', 0)
-                    print(f" @ ({x:.0f}, {y:.0f})")
-                else:
-                    print()
-        
-        print()
-    
+                    line += f" @ ({x:.0f}, {y:.0f})"
+                lines.append(line)
+
+        lines.append("")
+        self._out_q.put("\n".join(lines) + "\n")
+
+    def _writer_loop(self):
+        """Writer: vuelca lo encolado a stdout (un write + flush por ráfaga)"""
+        while True:
+            batch = [self._out_q.get()]
+            while True:
+                try:
+                    batch.append(self._out_q.get_nowait())
+                except Empty:
+                    break
+
+            done = None in batch
+            if done:
+                batch = batch[:batch.index(None)]
+            if batch:
+                sys.stdout.write("".join(batch))
+                sys.stdout.flush()
+            if done:
+                return
+
     def run(self):
         """Inicia el monitor"""
         # Signal handlers
@@ -134,11 +172,9 @@ class DataMonitor:
             print(f"❌ Error conectando: {e}")
             return
         
-        # Esperar
+        # Esperar (bloqueante, sin polling: _signal_handler setea stop_event)
         try:
-            while self.running:
-                import time
-                time.sleep(1)
+            self.stop_event.wait()
         except KeyboardInterrupt:
             pass
         
@@ -148,12 +184,16 @@ class DataMonitor:
     def _signal_handler(self, signum, frame):
         """Handler para señales"""
         print("\n\n⚠️ Deteniendo monitor...")
-        self.running = False
+        self.stop_event.set()
     
     def stop(self):
         """Detiene el monitor"""
         self.client.loop_stop()
         self.client.disconnect()
+
+        # Volcar lo pendiente antes de las estadísticas
+        self._out_q.put(None)
+        self._writer.join(timeout=2.0)
         
         # Mostrar estadísticas
         print("\n" + "="*70)
@@ -166,7 +206,7 @@ class DataMonitor:
             print("\nDetecciones por clase:")
             for class_name, count in sorted(
                 self.class_counts.items(),
-                key=lambda x: x[1],
+                key=itemgetter(1),
                 reverse=True
             ):
                 print(f"  {class_name}: {count}")
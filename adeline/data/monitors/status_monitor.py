@@ -12,10 +12,24 @@ import json
 import argparse
 import signal
 import sys
+from threading import Event
 from datetime import datetime
 
 import paho.mqtt.client as mqtt
 
+from ..serialization import loads
+
+
+# Emoji según el estado (armado una vez, no por mensaje)
+_STATUS_EMOJI = {
+    'connected': '🔗',
+    'started': '▶️',
+    'stopped': '⏹️',
+    'paused': '⏸️',
+    'running': '▶️',
+    'disconnected': '🔌'
+}
+
 
 class StatusMonitor:
     """Monitor de status del Control Plane"""
@@ -24,7 +38,7 @@ class StatusMonitor:
         self.broker = broker
         self.port = port
         self.topic = topic
-        self.running = True
+        self.stop_event = Event()
 
         # Cliente MQTT
         self.client = mqtt.Client(
@@ -54,8 +68,8 @@ class StatusMonitor:
     def _on_message(self, client, userdata, msg):
         """Callback cuando recibe un mensaje"""
         try:
-            payload = msg.payload.decode('utf-8')
-            data = json.loads(payload)
+            # loads acepta bytes (orjson/json): sin decode intermedio
+            data = loads(msg.payload)
 
             timestamp = data.get('timestamp', 'N/A')
             status = data.get('status', 'unknown')
@@ -63,15 +77,7 @@ class StatusMonitor:
 
             now = datetime.now().strftime("%H:%M:%S")
 
-            # Emoji según el estado
-            emoji = {
-                'connected': '🔗',
-                'started': '▶️',
-                'stopped': '⏹️',
-                'paused': '⏸️',
-                'running': '▶️',
-                'disconnected': '🔌'
-            }.get(status, '❓')
+            emoji = _STATUS_EMOJI.get(status, '❓')
 
             print(f"[{now}] {emoji} Status: {status.upper()} | Client: {client_id}")
             print(f"         Timestamp: {timestamp}\n")
@@ -96,11 +102,9 @@ class StatusMonitor:
             print(f"❌ Error conectando: {e}")
             return
 
-        # Esperar
+        # Esperar (bloqueante, sin polling: _signal_handler setea stop_event)
         try:
-            while self.running:
-                import time
-                time.sleep(1)
+            self.stop_event.wait()
         except KeyboardInterrupt:
             pass
 
@@ -110,7 +114,7 @@ class StatusMonitor:
     def _signal_handler(self, signum, frame):
         """Handler para señales"""
         print("\n\n⚠️ Deteniendo monitor...")
-        self.running = False
+        self.stop_event.set()
 
     def stop(self):
         """Detiene el monitor"""
@@ -10,16 +10,17 @@ Diseño: Complejidad por diseño
 - Publishers = lógica de negocio (formateo de mensajes)
 - SRP: Plane solo publica, Publishers formatean
 """
-import json
 import logging
+from datetime import datetime
 from threading import Event, Lock
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import paho.mqtt.client as mqtt
 from inference.core.interfaces.camera.entities import VideoFrame
 from inference.core.interfaces.stream.watchdog import BasePipelineWatchDog
 
 from .publishers import DetectionPublisher, MetricsPublisher
+from .serialization import dumps
 from adeline.logging import (
     log_mqtt_publish,
     log_pipeline_metrics,
@@ -54,6 +55,7 @@ class MQTTDataPlane:
         password: Optional[str] = None,
         publish_full_frame: bool = False,
         qos: int = 0,
+        metrics_qos: int = 0,
     ):
         self.broker_host = broker_host
         self.broker_port = broker_port
@@ -62,6 +64,7 @@ class MQTTDataPlane:
         self.client_id = client_id
         self.publish_full_frame = publish_full_frame
         self.qos = qos
+        self.metrics_qos = metrics_qos
 
         # Publishers (lógica de negocio)
         self.detection_publisher = DetectionPublisher()
@@ -77,6 +80,12 @@ class MQTTDataPlane:
 
         self._connected = Event()
         self._lock = Lock()
+        self._flush_callbacks: List[Callable[[], None]] = []
+        self._dropped_messages = 0
+
+        # Último mensaje de métricas publicado y su payload serializado
+        # (re-publicar el mismo snapshot no vuelve a serializar)
+        self._metrics_cache: Tuple[Optional[Dict[str, Any]], Any] = (None, None)
 
     def _on_connect(self, client, userdata, flags, rc, properties=None):
         """Callback cuando se conecta al broker"""
@@ -142,6 +151,21 @@ class MQTTDataPlane:
             )
             return False
 
+    def add_flush_callback(self, callback: Callable[[], None]):
+        """
+        Registra un callback a ejecutar antes de desconectar.
+
+        Usado por sinks con buffer (ej: BatchingMQTTSink) para publicar
+        mensajes pendientes antes de cerrar la conexión. Se ejecutan en
+        orden inverso al registro (el wrapper externo drena primero).
+        """
+        self._flush_callbacks.append(callback)
+
+    def record_dropped(self, count: int = 1):
+        """Registra mensajes descartados por sinks con backpressure."""
+        with self._lock:
+            self._dropped_messages += count
+
     def disconnect(self):
         """Desconecta del broker MQTT"""
         logger.info(
@@ -151,8 +175,21 @@ class MQTTDataPlane:
                 "event": "disconnecting",
             }
         )
-        self.client.loop_stop()
+        for flush in reversed(self._flush_callbacks):
+            try:
+                flush()
+            except Exception as e:
+                log_error_with_context(
+                    logger,
+                    message="❌ Error publicando mensajes pendientes",
+                    exception=e,
+                    component="data_plane",
+                    event="flush_error",
+                )
+        # disconnect() antes que loop_stop(): el network loop escribe lo
+        # encolado (status/flush) y el DISCONNECT, y recién ahí termina
         self.client.disconnect()
+        self.client.loop_stop()
 
     def publish_inference(
         self,
@@ -185,23 +222,26 @@ class MQTTDataPlane:
             # Formatear mensaje (delega a publisher)
             message = self.detection_publisher.format_message(predictions, video_frame)
 
+            # Serializar una sola vez (publish + payload_size del log)
+            payload = dumps(message)
+
             # Publicar (infraestructura MQTT)
             result = self.client.publish(
                 self.data_topic,
-                json.dumps(message, default=str),
+                payload,
                 qos=self.qos
             )
 
             if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                # Log exitoso con helper
-                num_detections = len(message.get('detections', []))
-                log_mqtt_publish(
-                    logger,
-                    topic=self.data_topic,
-                    qos=self.qos,
-                    payload_size=len(json.dumps(message, default=str)),
-                    num_detections=num_detections,
-                )
+                # Log exitoso (DEBUG, por frame: solo si está habilitado)
+                if logger.isEnabledFor(logging.DEBUG):
+                    log_mqtt_publish(
+                        logger,
+                        topic=self.data_topic,
+                        qos=self.qos,
+                        payload_size=len(payload),
+                        num_detections=len(message.get('detections', [])),
+                    )
             else:
                 logger.warning(
                     "⚠️ Error publicando mensaje",
@@ -223,6 +263,85 @@ class MQTTDataPlane:
                 topic=self.data_topic,
             )
 
+    def format_inference(
+        self,
+        predictions: Union[Dict[str, Any], List[Dict[str, Any]]],
+        video_frame: Optional[Union[VideoFrame, List[VideoFrame]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Formatea predicciones sin publicar (delega a DetectionPublisher).
+
+        Usado por sinks que acumulan mensajes (batching) para no retener
+        los frames hasta el flush.
+        """
+        return self.detection_publisher.format_message(predictions, video_frame)
+
+    def publish_inference_batch(self, messages: List[Dict[str, Any]]):
+        """
+        Publica varios mensajes de detección en un único MQTT PUBLISH.
+
+        Payload: {"timestamp", "batch_size", "messages": [...]}, donde cada
+        elemento tiene el mismo formato que publish_inference().
+
+        Args:
+            messages: Mensajes ya formateados (ver format_inference)
+        """
+        if not messages:
+            return
+
+        if not self._connected.is_set():
+            logger.warning(
+                "⚠️ Data Plane no conectado, batch descartado",
+                extra={
+                    "component": "data_plane",
+                    "event": "publish_skipped",
+                    "reason": "not_connected",
+                    "batch_size": len(messages),
+                }
+            )
+            return
+
+        try:
+            payload = dumps(
+                {
+                    "timestamp": datetime.now(),  # dumps() lo escribe en ISO 8601
+                    "batch_size": len(messages),
+                    "messages": messages,
+                }
+            )
+            result = self.client.publish(self.data_topic, payload, qos=self.qos)
+
+            if result.rc == mqtt.MQTT_ERR_SUCCESS:
+                if logger.isEnabledFor(logging.DEBUG):
+                    log_mqtt_publish(
+                        logger,
+                        topic=self.data_topic,
+                        qos=self.qos,
+                        payload_size=len(payload),
+                        num_detections=sum(m.get('detection_count', 0) for m in messages),
+                    )
+            else:
+                logger.warning(
+                    "⚠️ Error publicando batch",
+                    extra={
+                        "component": "data_plane",
+                        "event": "publish_failed",
+                        "mqtt_rc": result.rc,
+                        "topic": self.data_topic,
+                        "batch_size": len(messages),
+                    }
+                )
+
+        except Exception as e:
+            log_error_with_context(
+                logger,
+                message="❌ Error en publish_inference_batch",
+                exception=e,
+                component="data_plane",
+                event="publish_exception",
+                topic=self.data_topic,
+            )
+
     def set_watchdog(self, watchdog: BasePipelineWatchDog):
         """
         Conecta un watchdog para publicar métricas del pipeline.
@@ -241,7 +360,11 @@ class MQTTDataPlane:
             }
         )
 
-    def publish_metrics(self):
+    def publish_metrics(
+        self,
+        message: Optional[Dict[str, Any]] = None,
+        log_level: int = logging.INFO,
+    ) -> Optional[Dict[str, Any]]:
         """
         Publica métricas del watchdog vía MQTT.
 
@@ -250,8 +373,15 @@ class MQTTDataPlane:
         - Publica mensaje formateado vía MQTT
 
         Publica en topic: inference/data/metrics
+
+        Args:
+            message: Snapshot ya formateado a re-publicar (None = formatear ahora)
+            log_level: Nivel del log de métricas (DEBUG para el loop periódico)
+
+        Returns:
+            Mensaje publicado (snapshot reutilizable), o None si no se publicó
         """
-        if not self.metrics_publisher.has_watchdog:
+        if message is None and not self.metrics_publisher.has_watchdog:
             logger.warning(
                 "⚠️ Watchdog no configurado, no se pueden publicar métricas",
                 extra={
@@ -260,7 +390,7 @@ class MQTTDataPlane:
                     "reason": "no_watchdog",
                 }
             )
-            return
+            return None
 
         if not self._connected.is_set():
             logger.warning(
@@ -271,27 +401,37 @@ class MQTTDataPlane:
                     "reason": "not_connected",
                 }
             )
-            return
+            return None
 
         try:
-            # Formatear mensaje (delega a publisher)
-            message = self.metrics_publisher.format_message()
-
             if message is None:
-                logger.warning(
-                    "⚠️ No se pudo formatear mensaje de métricas",
-                    extra={
-                        "component": "data_plane",
-                        "event": "format_failed",
-                    }
-                )
-                return
+                # Formatear mensaje (delega a publisher)
+                message = self.metrics_publisher.format_message()
+
+                if message is None:
+                    logger.warning(
+                        "⚠️ No se pudo formatear mensaje de métricas",
+                        extra={
+                            "component": "data_plane",
+                            "event": "format_failed",
+                        }
+                    )
+                    return None
+
+                # Métrica propia del data plane (backpressure del sink MQTT)
+                message["data_messages_dropped"] = self._dropped_messages
+
+            cached_message, payload = self._metrics_cache
+            if message is not cached_message:
+                payload = dumps(message)
+                self._metrics_cache = (message, payload)
 
             # Publicar (infraestructura MQTT)
             result = self.client.publish(
                 self.metrics_topic,
-                json.dumps(message, default=str),
-                qos=0  # Fire-and-forget para métricas
+                payload,
+                qos=self.metrics_qos,  # Default 0: fire-and-forget
+                retain=False,
             )
 
             if result.rc == mqtt.MQTT_ERR_SUCCESS:
@@ -304,7 +444,9 @@ class MQTTDataPlane:
                     fps=throughput,
                     latency_ms=latency_ms,
                     component="data_plane",
+                    level=log_level,
                 )
+                return message
             else:
                 logger.warning(
                     "⚠️ Error publicando métricas",
@@ -325,12 +467,54 @@ class MQTTDataPlane:
                 event="publish_metrics_exception",
                 topic=self.metrics_topic,
             )
+        return None
 
     def get_stats(self) -> Dict[str, Any]:
         """Retorna estadísticas del data plane"""
-        with self._lock:
-            return {
-                "messages_published": self.detection_publisher.message_count,
-                "connected": self._connected.is_set(),
-                "topic": self.data_topic,
-            }
+        # Sin lock: cada campo es una lectura atómica (ints, Event, str) y
+        # los contadores son independientes entre sí
+        return {
+            "messages_published": self.detection_publisher.message_count,
+            "messages_dropped": self._dropped_messages,
+            "connected": self._connected.is_set(),
+            "topic": self.data_topic,
+        }
+
+
+class NullDataPlane:
+    """
+    Data Plane no-op (mqtt.enabled = false).
+
+    Misma interfaz que MQTTDataPlane sin cliente MQTT: no abre conexión,
+    no levanta el loop de paho y no serializa nada. Usado en benchmarks
+    o procesamiento offline de video.
+    """
+
+    client_id = "null_data_plane"
+
+    def connect(self, timeout: float = 5.0) -> bool:
+        return True
+
+    def disconnect(self):
+        pass
+
+    def add_flush_callback(self, callback: Callable[[], None]):
+        pass
+
+    def record_dropped(self, count: int = 1):
+        pass
+
+    def publish_inference(self, predictions, video_frame=None):
+        pass
+
+    def publish_inference_batch(self, messages: List[Dict[str, Any]]):
+        pass
+
+    def set_watchdog(self, watchdog: BasePipelineWatchDog):
+        pass
+
+    def publish_metrics(self, message=None, log_level=logging.INFO):
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"enabled": False}
@@ -89,20 +89,24 @@ class DetectionPublisher:
                 elif isinstance(pred_data, dict):
                     detections.append(self._extract_detection(pred_data))
 
+        # datetime crudo: dumps() lo escribe en ISO 8601 (sin isoformat() acá)
+        now = datetime.now()
+
         # Información del frame
         frame_info = {}
         if video_frame:
             frames = video_frame if isinstance(video_frame, list) else [video_frame]
             if frames and len(frames) > 0:
                 frame = frames[0]
+                frame_timestamp = getattr(frame, 'frame_timestamp', None)
                 frame_info = {
                     "frame_id": getattr(frame, 'frame_id', None),
                     "source_id": getattr(frame, 'source_id', None),
-                    "timestamp": getattr(frame, 'frame_timestamp', datetime.now()).isoformat()
+                    "timestamp": frame_timestamp if frame_timestamp is not None else now
                 }
 
         message = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "detection_count": len(detections),
             "detections": detections,
             "frame": frame_info,
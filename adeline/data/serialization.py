@@ -0,0 +1,56 @@
+"""
+Payload Serialization
+=====================
+
+Serialización JSON de payloads MQTT del Data Plane.
+
+Usa orjson si está instalado (C/Rust, serializa numpy nativo sin .tolist()),
+con fallback a json de stdlib. Ambos backends producen JSON equivalente:
+datetime/date se serializan en ISO 8601 (como .isoformat(), así que los
+mensajes pueden llevar datetime.now() directo) y el resto de los valores
+no serializables se convierten con str() (igual que default=str).
+
+Usage:
+    from adeline.data.serialization import dumps, loads
+    payload = dumps(message)      # bytes (orjson) | str (json)
+    data = loads(payload)
+"""
+import json
+from datetime import date
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Dependencia opcional: pip install orjson
+    orjson = None
+
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> Union[bytes, str]:
+        """Serializa obj a JSON (bytes, listo para client.publish)."""
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+
+    def loads(payload: Union[bytes, str]) -> Any:
+        """Deserializa payload JSON."""
+        return orjson.loads(payload)
+
+else:
+
+    def _default(obj: Any) -> str:
+        """datetime/date en ISO 8601 (igual que orjson), resto con str()."""
+        if isinstance(obj, date):
+            return obj.isoformat()
+        return str(obj)
+
+    def dumps(obj: Any) -> Union[bytes, str]:
+        """Serializa obj a JSON (str, listo para client.publish)."""
+        return json.dumps(obj, default=_default)
+
+    def loads(payload: Union[bytes, str]) -> Any:
+        """Deserializa payload JSON."""
+        return json.loads(payload)
@@ -4,11 +4,19 @@ MQTT Sink Factory
 
 Factory function para crear sinks compatibles con InferencePipeline.
 """
+import logging
+import time
+from collections import deque
+from queue import Empty, Full, Queue
+from threading import Condition, Thread
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from inference.core.interfaces.camera.entities import VideoFrame
 
 from .plane import MQTTDataPlane
+from adeline.logging import log_error_with_context
+
+logger = logging.getLogger(__name__)
 
 
 def create_mqtt_sink(data_plane: MQTTDataPlane) -> Callable:
@@ -36,3 +44,188 @@ def create_mqtt_sink(data_plane: MQTTDataPlane) -> Callable:
     mqtt_sink.__name__ = 'mqtt_sink'
 
     return mqtt_sink
+
+
+class BatchingMQTTSink:
+    """
+    Sink MQTT que agrupa predicciones en un único mensaje.
+
+    Acumula mensajes formateados y los publica juntos cuando:
+    - Se alcanzan max_batch mensajes (trigger por tamaño), o
+    - Pasan max_delay_ms desde el mensaje pendiente más viejo (trigger por tiempo)
+
+    Amortiza headers MQTT, writes TCP y ACKs del broker (QoS 1) entre
+    varios frames.
+
+    Diseño:
+    - Formatea en __call__ (no retiene VideoFrames hasta el flush)
+    - Un único thread flusher (Condition) publica todos los batches: salen
+      en orden y no se crea un thread por batch
+    - __name__ = 'mqtt_sink' (lo encuentra wrap_sinks_with_stabilization)
+    - Al desconectar el Data Plane se publica lo pendiente y se detiene el flusher
+
+    Usage:
+        sink = BatchingMQTTSink(data_plane, max_batch=16, max_delay_ms=50)
+        sink(predictions, video_frame)
+    """
+
+    __name__ = 'mqtt_sink'
+
+    def __init__(
+        self,
+        data_plane: MQTTDataPlane,
+        max_batch: int = 16,
+        max_delay_ms: int = 50,
+    ):
+        self._data_plane = data_plane
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000.0
+
+        # (monotonic de llegada, mensaje) en orden de llegada
+        self._buffer: deque = deque()
+        self._cond = Condition()
+        self._closed = False
+
+        self._worker = Thread(target=self._run, name="mqtt-batch-flusher", daemon=True)
+        self._worker.start()
+
+        data_plane.add_flush_callback(self.close)
+
+    def __call__(
+        self,
+        predictions: Union[Dict[str, Any], List[Dict[str, Any]]],
+        video_frame: Optional[Union[VideoFrame, List[VideoFrame]]] = None
+    ):
+        """Agrega predicciones al batch (el flusher lo publica)."""
+        message = self._data_plane.format_inference(predictions, video_frame)
+
+        with self._cond:
+            if not self._closed:
+                self._buffer.append((time.monotonic(), message))
+                # Despertar al flusher solo si cambia su espera: primer
+                # pendiente (arma el deadline) o batch lleno
+                if len(self._buffer) == 1 or len(self._buffer) >= self.max_batch:
+                    self._cond.notify()
+                return
+
+        # Flusher ya detenido (Data Plane desconectado): sin batch
+        self._data_plane.publish_inference_batch([message])
+
+    def close(self, timeout: float = 5.0):
+        """Publica lo pendiente y detiene el flusher."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._worker.join(timeout=timeout)
+
+    def _run(self):
+        """Worker: publica batches por tamaño o por tiempo (único publicador)."""
+        while True:
+            with self._cond:
+                while not self._buffer and not self._closed:
+                    self._cond.wait()
+                if not self._buffer:
+                    return  # Cerrado y sin pendientes
+
+                deadline = self._buffer[0][0] + self.max_delay
+                while len(self._buffer) < self.max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                count = min(len(self._buffer), self.max_batch)
+                batch = [self._buffer.popleft()[1] for _ in range(count)]
+
+            # Fuera del lock: el pipeline sigue encolando mientras se publica
+            self._data_plane.publish_inference_batch(batch)
+
+
+class LeakyAsyncSink:
+    """
+    Desacopla el sink MQTT del thread de inferencia (cola leaky de 1 slot).
+
+    El pipeline solo encola; un worker publica. Si el broker se atrasa y
+    el slot está ocupado, se descarta la predicción más vieja y se guarda
+    la nueva (drop-oldest): la latencia queda acotada a un frame y un
+    broker lento nunca frena la lectura de frames.
+
+    Diseño:
+    - __name__ = 'mqtt_sink' (lo encuentra wrap_sinks_with_stabilization)
+    - Descartes contabilizados en MQTTDataPlane.record_dropped (metrics)
+    - Al desconectar el Data Plane se publica lo pendiente y se detiene el worker
+
+    Usage:
+        sink = LeakyAsyncSink(create_mqtt_sink(data_plane), data_plane)
+        sink(predictions, video_frame)
+    """
+
+    __name__ = 'mqtt_sink'
+
+    def __init__(self, sink: Callable, data_plane: MQTTDataPlane):
+        self._sink = sink
+        self._data_plane = data_plane
+        self._queue: Queue = Queue(maxsize=1)
+
+        self._worker = Thread(target=self._run, name="mqtt-sink", daemon=True)
+        self._worker.start()
+
+        data_plane.add_flush_callback(self.close)
+
+    def __call__(
+        self,
+        predictions: Union[Dict[str, Any], List[Dict[str, Any]]],
+        video_frame: Optional[Union[VideoFrame, List[VideoFrame]]] = None
+    ):
+        """Encola predicciones (descarta la pendiente si el slot está ocupado)."""
+        item = (predictions, video_frame)
+        try:
+            self._queue.put_nowait(item)
+        except Full:
+            try:
+                self._queue.get_nowait()
+                self._data_plane.record_dropped()
+            except Empty:
+                pass  # El worker la tomó entre medio
+            try:
+                self._queue.put_nowait(item)
+            except Full:
+                self._data_plane.record_dropped()
+
+    def close(self, timeout: float = 5.0):
+        """
+        Publica lo pendiente y detiene el worker.
+
+        Si el worker está trabado (slot sin liberar en timeout) no bloquea
+        el shutdown: se descarta lo pendiente y el worker (daemon) queda.
+        """
+        try:
+            self._queue.put(None, timeout=timeout)
+        except Full:
+            logger.warning(
+                "⚠️ Sink MQTT asíncrono trabado, pendiente descartado",
+                extra={
+                    "component": "mqtt_sink",
+                    "event": "async_close_timeout",
+                    "timeout_s": timeout,
+                }
+            )
+            return
+        self._worker.join(timeout=timeout)
+
+    def _run(self):
+        """Worker: publica predicciones encoladas (None = fin)."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._sink(*item)
+            except Exception as e:
+                log_error_with_context(
+                    logger,
+                    message="❌ Error en sink MQTT asíncrono",
+                    exception=e,
+                    component="mqtt_sink",
+                    event="async_publish_error",
+                )
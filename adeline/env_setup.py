@@ -16,6 +16,9 @@ import os
 import yaml
 from pathlib import Path
 
+# Parser C (libyaml) si está disponible, SafeLoader puro Python si no
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def setup_model_environment() -> None:
     """
@@ -28,8 +31,7 @@ def setup_model_environment() -> None:
     config_file = Path(config_path)
 
     if config_file.exists():
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = yaml.load(config_file.read_bytes(), Loader=_YAML_LOADER)
 
         models_disabled_cfg = config.get('models_disabled', {})
         disabled_models = models_disabled_cfg.get('disabled', [])
@@ -14,6 +14,11 @@ Diseño: Complejidad por diseño
 from typing import Optional, Any
 import logging
 
+from ..stabilization import (
+    create_stabilization_strategy,
+    StabilizationConfig,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,11 +53,6 @@ class StrategyFactory:
             Lógica extraída de InferencePipelineController.setup()
             líneas 95-125 (detection stabilization wrapping).
         """
-        from ..stabilization import (
-            create_stabilization_strategy,
-            StabilizationConfig,
-        )
-
         if config.STABILIZATION_MODE == 'none':
             logger.info(
                 "Stabilization disabled",
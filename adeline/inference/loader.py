@@ -40,11 +40,20 @@ class InferenceLoader:
         from adeline.inference.loader import InferenceLoader
         inference = InferenceLoader.get_inference()  # ✅ Safe
         InferencePipeline = inference.InferencePipeline
+
+        # Ya cargado: clase cacheada en el loader
+        InferencePipeline = InferenceLoader.InferencePipeline
+
+        # O directamente (lazy, ver __getattr__ del módulo):
+        from adeline.inference.loader import InferencePipeline
     """
 
     _inference_module: Optional[Any] = None
     _models_disabled: bool = False
 
+    # Clase resuelta en el primer load (evita lookup en cada acceso)
+    InferencePipeline: Optional[Any] = None
+
     @classmethod
     def disable_models_from_config(cls, config_path: str = "config/adeline/config.yaml"):
         """
@@ -92,6 +101,7 @@ class InferenceLoader:
             # Importar inference (env vars ya configuradas por Makefile/env_setup)
             import inference
             cls._inference_module = inference
+            cls.InferencePipeline = inference.InferencePipeline
 
             logger.info(
                 "Inference module loaded",
@@ -112,6 +122,7 @@ class InferenceLoader:
         """
         cls._inference_module = None
         cls._models_disabled = False
+        cls.InferencePipeline = None
         logger.debug(
             "InferenceLoader reset",
             extra={
@@ -119,3 +130,17 @@ class InferenceLoader:
                 "event": "loader_reset",
             }
         )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Acceso lazy a símbolos de inference desde este módulo (PEP 562).
+
+    Permite `from adeline.inference.loader import InferencePipeline` sin
+    que cada módulo repita get_inference() + lookup del atributo.
+    """
+    if name == "InferencePipeline":
+        if InferenceLoader.InferencePipeline is None:
+            InferenceLoader.get_inference()
+        return InferenceLoader.InferencePipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -233,15 +233,17 @@ def adaptive_roi_inference(
     """
     Pipeline de inferencia con crop adaptativo optimizado.
 
-    Flow por frame:
-    1. Get ROI del estado compartido
-    2. Crop eficiente (numpy view - zero copy)
-    3. Inferencia con modelo (Roboflow o local ONNX)
-    4. Transform coords de vuelta al frame original (vectorizado)
+    Flow:
+    1. Get ROI del estado compartido (por frame)
+    2. Crop eficiente (numpy view - zero copy) (por frame)
+    3. Inferencia con modelo (Roboflow o local ONNX), una sola llamada
+       con todos los crops del batch
+    4. Transform coords de vuelta al frame original (vectorizado, por frame)
     5. Agregar métricas de ROI/performance (opcional, según show_statistics)
 
     Performance optimizations:
     - NumPy views para crop (no copia)
+    - Batch inference: N fuentes = 1 llamada al modelo (no N)
     - Operaciones vectorizadas para coordenadas
     - Supervision utilities para bbox ops
     - Metrics computation opcional (desactivar en producción para mejor performance)
@@ -265,7 +267,12 @@ def adaptive_roi_inference(
         )
         process_frame_fn = default_process_frame
 
-    results = []
+    # Fase 1: ROI + crop de todos los frames (multi-source = N frames)
+    rois = []
+    frames_to_infer = []
+    crop_offsets = []
+    model_size = getattr(roi_state, '_imgsz', None)
+    resize_to_model = getattr(roi_state, 'resize_to_model', False)
 
     for video_frame in video_frames:
         # 1. Get ROI del estado
@@ -283,22 +290,30 @@ def adaptive_roi_inference(
                 roi = roi_state.get_roi(source_id=video_frame.source_id)
 
         # 2. Crop eficiente (numpy view) + resize opcional
-        model_size = getattr(roi_state, '_imgsz', None)
-        resize_to_model = getattr(roi_state, 'resize_to_model', False)
         frame_to_infer, crop_offset = crop_frame_if_roi(
             video_frame,
             roi,
             model_size=model_size,
             resize_to_model=resize_to_model,
         )
+        rois.append(roi)
+        frames_to_infer.append(frame_to_infer)
+        crop_offsets.append(crop_offset)
+
+    # Fase 2: Inferencia en batch (una llamada para todos los crops)
+    # 3. Inferencia (función configurable: Roboflow o local ONNX)
+    predictions = process_frame_fn(
+        frames_to_infer,
+        model=model,
+        inference_config=inference_config
+    )
 
-        # 3. Inferencia (función configurable: Roboflow o local ONNX)
-        prediction = process_frame_fn(
-            [frame_to_infer],
-            model=model,
-            inference_config=inference_config
-        )[0]
+    # Fase 3: Transform + métricas por frame
+    results = []
 
+    for video_frame, roi, crop_offset, prediction in zip(
+        video_frames, rois, crop_offsets, predictions
+    ):
         # 4. Transform coords (vectorizado)
         prediction = transform_predictions_vectorized(prediction, crop_offset)
 
@@ -278,6 +278,9 @@ class TemporalHysteresisStabilizer(BaseDetectionStabilizer):
         tracks = self._tracks[source_id]
         stats = self._stats[source_id]
 
+        # Logs por detección: evaluar nivel una vez por frame
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         # Track matching usando HierarchicalMatcher (Strategy pattern)
         matched_tracks: Set[Tuple[str, int]] = set()  # (class_name, track_idx)
         stabilized_detections: List[Dict[str, Any]] = []
@@ -323,18 +326,19 @@ class TemporalHysteresisStabilizer(BaseDetectionStabilizer):
                         if not track.confirmed and track.consecutive_frames >= self.min_frames:
                             track.confirmed = True
                             stats['total_confirmed'] += 1
-                            logger.debug(
-                                f"✅ Track confirmed: {class_name}",
-                                extra={
-                                    "component": "stabilization",
-                                    "event": "track_confirmed",
-                                    "class_name": class_name,
-                                    "consecutive_frames": track.consecutive_frames,
-                                    "avg_confidence": track.avg_confidence,
-                                    "match_score": match_score,
-                                    "strategy": strategy_name,
-                                }
-                            )
+                            if debug:
+                                logger.debug(
+                                    f"✅ Track confirmed: {class_name}",
+                                    extra={
+                                        "component": "stabilization",
+                                        "event": "track_confirmed",
+                                        "class_name": class_name,
+                                        "consecutive_frames": track.consecutive_frames,
+                                        "avg_confidence": track.avg_confidence,
+                                        "match_score": match_score,
+                                        "strategy": strategy_name,
+                                    }
+                                )
                     else:
                         # Confianza insuficiente, marcar missed
                         track.mark_missed()
@@ -351,28 +355,30 @@ class TemporalHysteresisStabilizer(BaseDetectionStabilizer):
                     new_track.confidences.append(confidence)
                     tracks[class_name].append(new_track)
 
-                    logger.debug(
-                        f"🆕 New track: {class_name}",
-                        extra={
-                            "component": "stabilization",
-                            "event": "new_track",
-                            "class_name": class_name,
-                            "confidence": confidence,
-                            "min_frames_needed": self.min_frames,
-                        }
-                    )
+                    if debug:
+                        logger.debug(
+                            f"🆕 New track: {class_name}",
+                            extra={
+                                "component": "stabilization",
+                                "event": "new_track",
+                                "class_name": class_name,
+                                "confidence": confidence,
+                                "min_frames_needed": self.min_frames,
+                            }
+                        )
                 else:
                     stats['total_ignored'] += 1
-                    logger.debug(
-                        f"⏭️ Ignored detection: {class_name}",
-                        extra={
-                            "component": "stabilization",
-                            "event": "ignored_detection",
-                            "class_name": class_name,
-                            "confidence": confidence,
-                            "appear_threshold": self.appear_conf,
-                        }
-                    )
+                    if debug:
+                        logger.debug(
+                            f"⏭️ Ignored detection: {class_name}",
+                            extra={
+                                "component": "stabilization",
+                                "event": "ignored_detection",
+                                "class_name": class_name,
+                                "confidence": confidence,
+                                "appear_threshold": self.appear_conf,
+                            }
+                        )
 
         # 3. Update unmatched tracks (incrementar gap)
         for class_name, track_list in tracks.items():
@@ -413,16 +419,17 @@ class TemporalHysteresisStabilizer(BaseDetectionStabilizer):
             removed_count = initial_count - len(tracks[class_name])
             if removed_count > 0:
                 stats['total_removed'] += removed_count
-                logger.debug(
-                    f"🗑️ Removed expired tracks: {class_name}",
-                    extra={
-                        "component": "stabilization",
-                        "event": "tracks_removed",
-                        "class_name": class_name,
-                        "removed_count": removed_count,
-                        "max_gap": self.max_gap,
-                    }
-                )
+                if debug:
+                    logger.debug(
+                        f"🗑️ Removed expired tracks: {class_name}",
+                        extra={
+                            "component": "stabilization",
+                            "event": "tracks_removed",
+                            "class_name": class_name,
+                            "removed_count": removed_count,
+                            "max_gap": self.max_gap,
+                        }
+                    )
 
             # Limpiar clase si no hay tracks
             if not tracks[class_name]:
@@ -643,7 +650,7 @@ def create_stabilization_sink(
         if isinstance(predictions, dict):
             # Formato standard de inference SDK
             raw_detections = predictions.get('predictions', [])
-            source_id = video_frame.source_id if hasattr(video_frame, 'source_id') else 0
+            source_id = getattr(video_frame, 'source_id', 0)
 
             # Estabilizar
             stabilized = stabilizer.process(raw_detections, source_id=source_id)
@@ -655,11 +662,13 @@ def create_stabilization_sink(
             # Agregar metadata de estabilización
             predictions_stabilized['_stabilization_stats'] = stabilizer.get_stats(source_id)
 
-            # Log comparación
-            logger.debug(
-                f"Stabilization wrapper: {len(raw_detections)} raw → {len(stabilized)} stable "
-                f"(source={source_id})"
-            )
+            # Log comparación (isEnabledFor por frame: usa el cache del
+            # logger y sigue cambios de nivel en runtime)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Stabilization wrapper: %d raw → %d stable (source=%s)",
+                    len(raw_detections), len(stabilized), source_id,
+                )
 
             # Pasar a downstream
             downstream_sink(predictions_stabilized, video_frame)
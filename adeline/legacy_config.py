@@ -15,6 +15,9 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Parser C (libyaml) si está disponible, SafeLoader puro Python si no
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 # ============================================================================
 # MODEL DISABLING (before importing inference)
@@ -40,8 +43,7 @@ def disable_models_from_config(config_path: str = "config/adeline/config.yaml"):
             os.environ[f"{model}_ENABLED"] = "False"
         return
 
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+    config = yaml.load(config_file.read_bytes(), Loader=_YAML_LOADER)
 
     models_disabled_cfg = config.get('models_disabled', {})
     disabled_models = models_disabled_cfg.get('disabled', [])
@@ -71,8 +73,7 @@ class PipelineConfig:
                 f"Please create it from config/adeline/config.yaml.example"
             )
 
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = yaml.load(config_file.read_bytes(), Loader=_YAML_LOADER)
 
         # Inference Pipeline
         pipeline_cfg = config.get('pipeline', {})
@@ -81,6 +82,9 @@ class PipelineConfig:
         self.MAX_FPS = pipeline_cfg.get('max_fps', 2)
         self.ENABLE_VISUALIZATION = pipeline_cfg.get('enable_visualization', True)
         self.DISPLAY_STATISTICS = pipeline_cfg.get('display_statistics', True)
+        self.FORCE_EXIT = pipeline_cfg.get('force_exit', False)
+        self.IO_CPUS = pipeline_cfg.get('io_cpus')
+        self.INFERENCE_CPUS = pipeline_cfg.get('inference_cpus')
 
         # Models configuration
         models_cfg = config.get('models', {})
@@ -102,6 +106,7 @@ class PipelineConfig:
         # MQTT Broker
         mqtt_cfg = config.get('mqtt', {})
         broker_cfg = mqtt_cfg.get('broker', {})
+        self.MQTT_ENABLED = mqtt_cfg.get('enabled', True)
         self.MQTT_BROKER = broker_cfg.get('host', 'localhost')
         self.MQTT_PORT = broker_cfg.get('port', 1883)
 
@@ -120,6 +125,22 @@ class PipelineConfig:
         qos_cfg = mqtt_cfg.get('qos', {})
         self.CONTROL_QOS = qos_cfg.get('control', 1)
         self.DATA_QOS = qos_cfg.get('data', 0)
+        self.METRICS_QOS = qos_cfg.get('metrics', 0)
+
+        # MQTT Batching (data plane, 1 = sin batching)
+        batching_cfg = mqtt_cfg.get('batching', {})
+        self.MQTT_BATCH_SIZE = batching_cfg.get('size', 1)
+        self.MQTT_BATCH_MS = batching_cfg.get('max_delay_ms', 50)
+
+        # Data plane pool (conexiones MQTT para publicar inferencias;
+        # con > 1 no hay orden garantizado entre frames consecutivos)
+        self.DATA_PLANE_POOL_SIZE = mqtt_cfg.get('data_pool_size', 1)
+
+        # Sink MQTT asíncrono (worker + cola leaky de 1 slot, opt-in)
+        self.MQTT_ASYNC_SINK = mqtt_cfg.get('async_sink', False)
+
+        # Publicación periódica de métricas (0 = solo comando METRICS)
+        self.METRICS_INTERVAL_S = mqtt_cfg.get('metrics_interval_s', 5.0)
 
         # Logging
         logging_cfg = config.get('logging', {})
@@ -128,6 +149,11 @@ class PipelineConfig:
         self.JSON_INDENT = logging_cfg.get('json_indent', None)
         self.PAHO_LOG_LEVEL = logging_cfg.get('paho_level', 'WARNING')
 
+        # Niveles numéricos (resueltos una vez, no por getattr en cada uso)
+        levels = logging.getLevelNamesMapping()
+        self.LOG_LEVEL_NO = levels[self.LOG_LEVEL.upper()]
+        self.PAHO_LOG_LEVEL_NO = levels[self.PAHO_LOG_LEVEL.upper()]
+
         # File rotation (opcional)
         self.LOG_FILE = logging_cfg.get('file', None)  # None = stdout
         self.LOG_MAX_BYTES = logging_cfg.get('max_bytes', 10 * 1024 * 1024)  # 10 MB
@@ -44,7 +44,7 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from contextvars import ContextVar
 from contextlib import contextmanager
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 import uuid
 
 # ============================================================================
@@ -107,7 +107,7 @@ def trace_context(trace_id: Optional[str] = None):
 # ============================================================================
 
 def setup_logging(
-    level: str = "INFO",
+    level: Union[str, int] = "INFO",
     indent: Optional[int] = None,
     add_fields: Optional[Dict[str, Any]] = None,
     log_file: Optional[str] = None,
@@ -118,7 +118,7 @@ def setup_logging(
     Configura structured logging (JSON) para toda la aplicación.
 
     Args:
-        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL o su valor numérico)
         indent: JSON indent para pretty-print (None = compact, 2 = readable)
         add_fields: Campos adicionales globales (ej: {"environment": "production"})
         log_file: Path al archivo de logs (None = stdout). Si se especifica, usa rotation.
@@ -207,7 +207,7 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.handlers.clear()  # Remove default handlers
     root_logger.addHandler(handler)
-    root_logger.setLevel(getattr(logging, level.upper()))
+    root_logger.setLevel(level.upper() if isinstance(level, str) else level)
 
 
 # ============================================================================
@@ -231,6 +231,9 @@ def log_mqtt_command(
         payload: Payload completo del comando (opcional)
         trace_id: Trace ID (usa contexto si no se especifica)
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return  # Sin armar extra ni mensaje si el record se descarta
+
     extra = {
         "component": "control_plane",
         "command": command,
@@ -241,7 +244,7 @@ def log_mqtt_command(
     if payload:
         extra["payload"] = payload
 
-    logger.info(f"📥 Comando recibido: {command}", extra=extra)
+    logger.info("📥 Comando recibido: %s", command, extra=extra)
 
 
 def log_mqtt_publish(
@@ -267,6 +270,10 @@ def log_mqtt_publish(
         num_detections: Número de detecciones en el payload (opcional)
         component: Componente que genera el log
     """
+    level = logging.DEBUG if success else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return  # Sin armar extra ni mensaje si el record se descarta
+
     extra = {
         "component": component,
         "mqtt_topic": topic,
@@ -282,9 +289,9 @@ def log_mqtt_publish(
         extra["num_detections"] = num_detections
 
     if success:
-        logger.debug(f"📤 Mensaje publicado a {topic}", extra=extra)
+        logger.debug("📤 Mensaje publicado a %s", topic, extra=extra)
     else:
-        logger.warning(f"⚠️ Error publicando a {topic}", extra=extra)
+        logger.warning("⚠️ Error publicando a %s", topic, extra=extra)
 
 
 def log_pipeline_metrics(
@@ -292,7 +299,9 @@ def log_pipeline_metrics(
     fps: float,
     latency_ms: Optional[float] = None,
     frames_processed: Optional[int] = None,
-    additional_metrics: Optional[Dict[str, Any]] = None
+    additional_metrics: Optional[Dict[str, Any]] = None,
+    component: str = "inference_pipeline",
+    level: int = logging.INFO,
 ) -> None:
     """
     Helper para logs de métricas del pipeline.
@@ -303,7 +312,12 @@ def log_pipeline_metrics(
         latency_ms: Latencia en milisegundos
         frames_processed: Total de frames procesados
         additional_metrics: Métricas adicionales
+        component: Componente que genera el log
+        level: Nivel del log (DEBUG para publicaciones periódicas)
     """
+    if not logger.isEnabledFor(level):
+        return  # Sin armar extra ni mensaje si el record se descarta
+
     metrics = {"fps": round(fps, 2)}
 
     if latency_ms is not None:
@@ -316,11 +330,11 @@ def log_pipeline_metrics(
         metrics.update(additional_metrics)
 
     extra = {
-        "component": "inference_pipeline",
+        "component": component,
         "metrics": metrics
     }
 
-    logger.info(f"📊 Pipeline metrics: {fps:.2f} FPS", extra=extra)
+    logger.log(level, "📊 Pipeline metrics: %.2f FPS", fps, extra=extra)
 
 
 def log_stabilization_stats(
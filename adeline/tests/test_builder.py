@@ -0,0 +1,129 @@
+"""
+Pipeline Builder Tests
+======================
+
+Tests de composición de callbacks del PipelineBuilder.
+
+Invariantes testeadas:
+1. _fuse_sinks: llama a todos los sinks en orden (0, 1 o muchos)
+2. Un sink que falla se loguea y no corta a los siguientes
+3. _fuse_status_handlers: mismo contrato para status update handlers
+"""
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+from adeline.app.builder import PipelineBuilder
+
+
+def make_recording_sinks(n, calls):
+    """Helper: n sinks que registran (índice, args) en calls."""
+    def make_sink(i):
+        def sink(predictions, video_frame):
+            calls.append((i, predictions, video_frame))
+        sink.__name__ = f"sink_{i}"
+        return sink
+
+    return [make_sink(i) for i in range(n)]
+
+
+@pytest.mark.unit
+class TestFuseSinks:
+    """Tests de PipelineBuilder._fuse_sinks (reemplazo de multi_sink)"""
+
+    def test_no_sinks_is_noop(self):
+        """
+        Propiedad: sin sinks el callback no hace nada (ni falla).
+        """
+        fused = PipelineBuilder._fuse_sinks([])
+
+        assert fused({"predictions": []}, None) is None
+
+    def test_single_sink_receives_arguments(self):
+        """
+        Invariante: con un sink se le pasan predictions y video_frame.
+        """
+        sink = Mock()
+        fused = PipelineBuilder._fuse_sinks([sink])
+
+        fused("preds", "frame")
+
+        sink.assert_called_once_with("preds", "frame")
+
+    def test_many_sinks_called_in_order(self):
+        """
+        Invariante: todos los sinks se llaman, en el orden de la lista.
+        """
+        calls = []
+        fused = PipelineBuilder._fuse_sinks(make_recording_sinks(10, calls))
+
+        fused("preds", "frame")
+
+        assert calls == [(i, "preds", "frame") for i in range(10)]
+
+    def test_failing_sink_does_not_stop_others(self, caplog):
+        """
+        Invariante (contrato multi_sink): la excepción de un sink se loguea
+        y los siguientes se ejecutan igual.
+        """
+        calls = []
+        sinks = make_recording_sinks(3, calls)
+        failing = Mock(side_effect=RuntimeError("boom"), __name__="failing_sink")
+        fused = PipelineBuilder._fuse_sinks([sinks[0], failing, sinks[1], sinks[2]])
+
+        with caplog.at_level(logging.ERROR):
+            fused("preds", "frame")
+
+        assert [i for i, _, _ in calls] == [0, 1, 2]
+        errors = [r for r in caplog.records if getattr(r, "event", None) == "sink_error"]
+        assert len(errors) == 1
+        assert errors[0].sink_name == "failing_sink"
+
+    def test_sink_list_is_copied(self):
+        """
+        Propiedad: mutar la lista después de componer no cambia el dispatcher.
+        """
+        first, late = Mock(), Mock()
+        sinks = [first]
+        fused = PipelineBuilder._fuse_sinks(sinks)
+        sinks.append(late)
+
+        fused("preds", "frame")
+
+        first.assert_called_once()
+        late.assert_not_called()
+
+
+@pytest.mark.unit
+class TestFuseStatusHandlers:
+    """Tests de PipelineBuilder._fuse_status_handlers"""
+
+    def test_handlers_called_in_order(self):
+        """
+        Invariante: cada handler recibe el status update, en orden.
+        """
+        calls = []
+        handlers = [Mock(side_effect=lambda s, i=i: calls.append((i, s))) for i in range(3)]
+        fused = PipelineBuilder._fuse_status_handlers(handlers)
+
+        fused("status")
+
+        assert calls == [(0, "status"), (1, "status"), (2, "status")]
+
+    def test_failing_handler_does_not_stop_others(self, caplog):
+        """
+        Invariante: un handler que falla se loguea (warning) y no corta a
+        los demás.
+        """
+        failing = Mock(side_effect=ValueError("bad"), __name__="failing_handler")
+        after = Mock()
+        fused = PipelineBuilder._fuse_status_handlers([failing, after])
+
+        with caplog.at_level(logging.WARNING):
+            fused("status")
+
+        after.assert_called_once_with("status")
+        errors = [r for r in caplog.records if getattr(r, "event", None) == "status_handler_error"]
+        assert len(errors) == 1
+        assert errors[0].handler_name == "failing_handler"
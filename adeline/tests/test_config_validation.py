@@ -10,14 +10,18 @@ Invariantes testeadas:
 3. Validación de relaciones (persist_conf <= appear_conf)
 4. Validación de bounds (x_min < x_max, etc)
 """
+import os
+
 import pytest
 from pydantic import ValidationError
-from config.schemas import (
+from adeline.config.schemas import (
     AdelineConfig,
     ModelsSettings,
     HysteresisStabilizationSettings,
     FixedROISettings,
     AdaptiveROISettings,
+    MQTTBatchingSettings,
+    PipelineSettings,
 )
 
 
@@ -220,6 +224,117 @@ class TestAdaptiveROIValidation:
             AdaptiveROISettings(smoothing=-0.1)
 
 
+@pytest.mark.unit
+class TestPipelineSettingsValidation:
+    """Tests de validación de PipelineSettings (CPU pinning)"""
+
+    def test_cpu_pinning_disabled_by_default(self):
+        """
+        Invariante: Sin pinning por defecto, io_cpus/inference_cpus se propagan.
+        """
+        legacy = AdelineConfig().to_legacy_config()
+        assert legacy.IO_CPUS is None
+        assert legacy.INFERENCE_CPUS is None
+
+        config = AdelineConfig(pipeline={'io_cpus': [0], 'inference_cpus': [1, 2, 3]})
+        legacy = config.to_legacy_config()
+        assert legacy.IO_CPUS == [0]
+        assert legacy.INFERENCE_CPUS == [1, 2, 3]
+
+    def test_cpu_list_validation(self):
+        """
+        Invariante: Lista de CPUs no vacía y con ids >= 0.
+        """
+        with pytest.raises(ValidationError):
+            PipelineSettings(io_cpus=[])
+
+        with pytest.raises(ValidationError):
+            PipelineSettings(inference_cpus=[-1])
+
+
+@pytest.mark.unit
+class TestMQTTBatchingValidation:
+    """Tests de validación de MQTTBatchingSettings"""
+
+    def test_default_is_no_batching(self):
+        """
+        Invariante: Por defecto no hay batching (un mensaje MQTT por frame).
+        """
+        settings = MQTTBatchingSettings()
+        assert settings.size == 1
+
+    def test_legacy_config_exposes_batching(self):
+        """
+        Invariante: to_legacy_config() propaga batching a MQTT_BATCH_*.
+        """
+        config = AdelineConfig(mqtt={'batching': {'size': 16, 'max_delay_ms': 40}})
+        legacy = config.to_legacy_config()
+
+        assert legacy.MQTT_BATCH_SIZE == 16
+        assert legacy.MQTT_BATCH_MS == 40
+
+    def test_size_range_validation(self):
+        """
+        Invariante: size >= 1.
+        """
+        with pytest.raises(ValidationError):
+            MQTTBatchingSettings(size=0)
+
+        with pytest.raises(ValidationError):
+            MQTTBatchingSettings(max_delay_ms=0)
+
+
+@pytest.mark.unit
+class TestMQTTSettingsValidation:
+    """Tests de validación de MQTTSettings (enabled, data_pool_size)"""
+
+    def test_mqtt_enabled_by_default(self):
+        """
+        Invariante: MQTT habilitado por defecto, mqtt.enabled=false se propaga.
+        """
+        assert AdelineConfig().to_legacy_config().MQTT_ENABLED is True
+
+        config = AdelineConfig(mqtt={'enabled': False})
+        assert config.to_legacy_config().MQTT_ENABLED is False
+
+    def test_metrics_qos_defaults_to_zero(self):
+        """
+        Invariante: métricas con QoS 0 por defecto, mqtt.qos.metrics se propaga.
+        """
+        assert AdelineConfig().to_legacy_config().METRICS_QOS == 0
+
+        config = AdelineConfig(mqtt={'qos': {'metrics': 1}})
+        assert config.to_legacy_config().METRICS_QOS == 1
+
+    def test_legacy_config_exposes_data_pool_size(self):
+        """
+        Invariante: to_legacy_config() propaga data_pool_size (default 1).
+        """
+        assert AdelineConfig().to_legacy_config().DATA_PLANE_POOL_SIZE == 1
+
+        config = AdelineConfig(mqtt={'data_pool_size': 3})
+        assert config.to_legacy_config().DATA_PLANE_POOL_SIZE == 3
+
+    def test_metrics_interval_rejects_negative(self):
+        """
+        Invariante: metrics_interval_s >= 0 (0 desactiva la publicación periódica).
+        """
+        assert AdelineConfig().to_legacy_config().METRICS_INTERVAL_S == 5.0
+        assert AdelineConfig(mqtt={'metrics_interval_s': 0}).mqtt.metrics_interval_s == 0
+
+        with pytest.raises(ValidationError):
+            AdelineConfig(mqtt={'metrics_interval_s': -1})
+
+    def test_async_sink_disabled_by_default(self):
+        """
+        Invariante: sink MQTT asíncrono (leaky, descarta frames) es opt-in.
+        """
+        assert AdelineConfig().to_legacy_config().MQTT_ASYNC_SINK is False
+
+        config = AdelineConfig(mqtt={'async_sink': True})
+        assert config.to_legacy_config().MQTT_ASYNC_SINK is True
+
+
 @pytest.mark.unit
 class TestAdelineConfigDefaults:
     """Tests de configuración completa con defaults"""
@@ -261,6 +376,30 @@ class TestAdelineConfigDefaults:
         assert config.roi_strategy.adaptive.min_roi_multiple <= \
                config.roi_strategy.adaptive.max_roi_multiple
 
+    def test_legacy_config_resolves_log_levels(self):
+        """
+        Invariante: to_legacy_config() expone niveles de log numéricos.
+        """
+        legacy = AdelineConfig(logging={'level': 'DEBUG'}).to_legacy_config()
+
+        assert legacy.LOG_LEVEL_NO == 10  # logging.DEBUG
+        assert legacy.PAHO_LOG_LEVEL_NO == 30  # logging.WARNING (default)
+
+    def test_legacy_config_reflects_copied_config(self):
+        """
+        Invariante: to_legacy_config() de una copia (model_copy) refleja los
+        valores de la copia, no los del original.
+        """
+        config = AdelineConfig()
+        assert config.to_legacy_config().MQTT_ENABLED is True
+
+        copied = config.model_copy(
+            update={'mqtt': config.mqtt.model_copy(update={'enabled': False})}
+        )
+
+        assert copied.to_legacy_config().MQTT_ENABLED is False
+        assert config.to_legacy_config().MQTT_ENABLED is True
+
 
 @pytest.mark.unit
 class TestConfigFromDict:
@@ -371,6 +510,76 @@ class TestConfigFromDict:
         assert config.roi_strategy.mode == 'adaptive'
 
 
+@pytest.mark.unit
+class TestConfigFromYaml:
+    """Tests de carga desde archivo YAML (from_yaml)"""
+
+    def test_missing_file_raises(self, tmp_path):
+        """
+        Invariante: Archivo inexistente produce FileNotFoundError.
+        """
+        with pytest.raises(FileNotFoundError):
+            AdelineConfig.from_yaml(str(tmp_path / "missing.yaml"))
+
+    def test_each_load_returns_independent_instance(self, tmp_path):
+        """
+        Invariante: Cada from_yaml devuelve una instancia propia; mutar
+        una no afecta cargas posteriores.
+        """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("pipeline:\n  max_fps: 5\n")
+
+        first = AdelineConfig.from_yaml(str(config_file))
+        first.pipeline.max_fps = 99
+        second = AdelineConfig.from_yaml(str(config_file))
+
+        assert second is not first
+        assert second.pipeline.max_fps == 5
+
+    def test_same_size_edit_with_same_mtime_is_reloaded(self, tmp_path):
+        """
+        Invariante: Una edición del mismo tamaño dentro del mismo tick de
+        mtime (filesystems de timestamps gruesos) se lee igual.
+        """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("pipeline:\n  max_fps: 5\n")
+        stat = config_file.stat()
+        AdelineConfig.from_yaml(str(config_file))
+
+        config_file.write_text("pipeline:\n  max_fps: 6\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        second = AdelineConfig.from_yaml(str(config_file))
+
+        assert second.pipeline.max_fps == 6
+
+    def test_json_config_accepted(self, tmp_path):
+        """
+        Propiedad: from_yaml acepta config.json con la misma estructura.
+        """
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"pipeline": {"max_fps": 7}, "models": {"imgsz": 640}}')
+
+        config = AdelineConfig.from_yaml(str(config_file))
+
+        assert config.pipeline.max_fps == 7
+        assert config.models.imgsz == 640
+
+    def test_env_credentials_override_yaml(self, tmp_path, monkeypatch):
+        """
+        Propiedad: MQTT_USERNAME/MQTT_PASSWORD pisan el YAML (aunque no
+        tenga sección mqtt.broker).
+        """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("pipeline:\n  max_fps: 5\n")
+        monkeypatch.setenv("MQTT_USERNAME", "env_user")
+        monkeypatch.setenv("MQTT_PASSWORD", "env_pass")
+
+        config = AdelineConfig.from_yaml(str(config_file))
+
+        assert config.mqtt.broker.username == "env_user"
+        assert config.mqtt.broker.password == "env_pass"
+
+
 @pytest.mark.unit
 class TestConfigValidationErrors:
     """Tests de mensajes de error de validación"""
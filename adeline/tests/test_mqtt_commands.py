@@ -48,6 +48,8 @@ class TestCommandRegistry:
         # Verificar que el error menciona comandos disponibles
         assert 'nonexistent_command' in str(exc_info.value)
         assert 'Available commands' in str(exc_info.value)
+        assert exc_info.value.command == 'nonexistent_command'
+        assert exc_info.value.available == ()
 
     def test_is_available(self):
         """
@@ -76,6 +78,11 @@ class TestCommandRegistry:
         registry.register('cmd2', lambda: None, "Command 2")
 
         assert registry.available_commands == {'cmd1', 'cmd2'}
+        assert registry.available_sorted == ('cmd1', 'cmd2')
+
+        # register() invalida el orden cacheado
+        registry.register('cmd0', lambda: None, "Command 0")
+        assert registry.available_sorted == ('cmd0', 'cmd1', 'cmd2')
 
     def test_get_help(self):
         """
@@ -106,6 +113,28 @@ class TestCommandRegistry:
         # Verificar warning
         assert any("sobrescribiendo" in record.message.lower() for record in caplog.records)
 
+    def test_freeze_closes_command_set(self):
+        """
+        Invariante: Después de freeze() no se registran comandos nuevos,
+        pero los existentes siguen ejecutándose.
+        """
+        registry = CommandRegistry()
+
+        executed = []
+        registry.register('pause', lambda: executed.append('pause'), "Pause")
+        registry.freeze()
+
+        assert registry.frozen
+        with pytest.raises(RuntimeError):
+            registry.register('resume', lambda: None, "Resume")
+
+        registry.execute('pause')
+        assert executed == ['pause']
+
+        # El mensaje de error usa los comandos ordenados cacheados
+        with pytest.raises(CommandNotAvailableError, match="Available commands: pause"):
+            registry.execute('resume')
+
 
 @pytest.mark.unit
 @pytest.mark.mqtt
@@ -0,0 +1,286 @@
+"""
+MQTT Sink Tests
+===============
+
+Tests de los sinks MQTT del Data Plane.
+
+Invariantes testeadas:
+1. LeakyAsyncSink: drop-oldest con un slot, descartes contabilizados
+2. LeakyAsyncSink.close(): publica lo pendiente, no cuelga con worker trabado
+3. Sink factory: publicación inline por defecto, LeakyAsyncSink solo opt-in
+4. BatchingMQTTSink: flush por tamaño, por tiempo y al desconectar, en orden
+5. Sink factory: batching con cualquier QoS (incluido 0)
+"""
+import threading
+import time
+from threading import Event
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from adeline.app.factories.sink_factory import _create_mqtt_sink_factory
+from adeline.data import BatchingMQTTSink, LeakyAsyncSink
+
+
+def make_blocking_sink():
+    """
+    Helper: sink que se bloquea hasta release (simula broker atrasado).
+
+    Returns:
+        (sink, started, release, published)
+    """
+    started, release = Event(), Event()
+    published = []
+
+    def sink(predictions, video_frame=None):
+        started.set()
+        release.wait(timeout=2.0)
+        published.append(predictions)
+
+    return sink, started, release, published
+
+
+@pytest.mark.unit
+@pytest.mark.mqtt
+class TestLeakyAsyncSink:
+    """Tests de LeakyAsyncSink (cola leaky de 1 slot)"""
+
+    def test_drops_oldest_and_counts_drop(self):
+        """
+        Invariante: con el slot ocupado se descarta la predicción más vieja
+        y se registra en data_plane.record_dropped().
+        """
+        inner, started, release, published = make_blocking_sink()
+        data_plane = Mock()
+        sink = LeakyAsyncSink(inner, data_plane)
+
+        sink("p1")
+        assert started.wait(timeout=2.0)  # Worker tomó p1 y está bloqueado
+        sink("p2")  # Ocupa el slot
+        sink("p3")  # Reemplaza a p2
+
+        data_plane.record_dropped.assert_called_once_with()
+
+        release.set()
+        sink.close(timeout=2.0)
+        assert published == ["p1", "p3"]
+
+    def test_close_publishes_pending(self):
+        """
+        Invariante: close() publica lo encolado antes de detener el worker.
+        """
+        published = []
+        sink = LeakyAsyncSink(lambda p, f=None: published.append(p), Mock())
+
+        sink("p1")
+        sink.close(timeout=2.0)
+
+        assert published == ["p1"]
+        assert not sink._worker.is_alive()
+
+    def test_close_does_not_hang_on_wedged_worker(self):
+        """
+        Invariante: si el worker no libera el slot, close() retorna tras el
+        timeout (no cuelga el shutdown).
+        """
+        inner, started, release, published = make_blocking_sink()
+        sink = LeakyAsyncSink(inner, Mock())
+
+        sink("p1")
+        assert started.wait(timeout=2.0)
+        sink("p2")  # Slot ocupado: el sentinel no entra
+
+        sink.close(timeout=0.05)
+        assert sink._worker.is_alive()
+
+        release.set()  # Liberar el worker (daemon) para no dejarlo colgado
+
+
+def make_batch_plane():
+    """
+    Helper: Data Plane mock que formatea identidad y registra los batches.
+
+    Returns:
+        (data_plane, batches)
+    """
+    batches = []
+    data_plane = Mock()
+    data_plane.format_inference.side_effect = lambda predictions, video_frame=None: predictions
+    data_plane.publish_inference_batch.side_effect = lambda messages: batches.append(list(messages))
+    return data_plane, batches
+
+
+def wait_for(condition, timeout=2.0):
+    """Helper: espera (poll corto) a que condition() sea verdadera."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+@pytest.mark.unit
+@pytest.mark.mqtt
+class TestBatchingMQTTSink:
+    """Tests de BatchingMQTTSink (batch por tamaño/tiempo, un flusher)"""
+
+    def test_size_flush(self):
+        """
+        Invariante: al llegar a max_batch se publica sin esperar el delay.
+        """
+        data_plane, batches = make_batch_plane()
+        sink = BatchingMQTTSink(data_plane, max_batch=3, max_delay_ms=5000)
+
+        for p in ("p1", "p2", "p3"):
+            sink(p)
+
+        assert wait_for(lambda: batches)
+        assert batches == [["p1", "p2", "p3"]]
+        sink.close(timeout=2.0)
+
+    def test_time_flush(self):
+        """
+        Invariante: un batch parcial se publica tras max_delay_ms.
+        """
+        data_plane, batches = make_batch_plane()
+        sink = BatchingMQTTSink(data_plane, max_batch=100, max_delay_ms=20)
+
+        sink("p1")
+        sink("p2")
+
+        assert wait_for(lambda: batches)
+        assert batches == [["p1", "p2"]]
+        sink.close(timeout=2.0)
+
+    def test_flush_on_disconnect(self):
+        """
+        Invariante: close() (flush callback del Data Plane) publica lo
+        pendiente y detiene el flusher.
+        """
+        data_plane, batches = make_batch_plane()
+        sink = BatchingMQTTSink(data_plane, max_batch=100, max_delay_ms=5000)
+        data_plane.add_flush_callback.assert_called_once_with(sink.close)
+
+        sink("p1")
+        sink("p2")
+        sink.close(timeout=2.0)
+
+        assert batches == [["p1", "p2"]]
+        assert not sink._worker.is_alive()
+
+        # Ya cerrado: publica directo, sin batch
+        sink("p3")
+        assert batches == [["p1", "p2"], ["p3"]]
+
+    def test_batches_published_in_order(self):
+        """
+        Invariante: con publish lento y triggers por tamaño y tiempo
+        mezclados, los mensajes salen en orden de llegada y sin repetidos.
+        """
+        data_plane, batches = make_batch_plane()
+        publish = data_plane.publish_inference_batch.side_effect
+
+        def slow_publish(messages):
+            time.sleep(0.002)
+            publish(messages)
+
+        data_plane.publish_inference_batch.side_effect = slow_publish
+        sink = BatchingMQTTSink(data_plane, max_batch=4, max_delay_ms=1)
+
+        for i in range(200):
+            sink(i)
+            if i % 7 == 0:
+                time.sleep(0.003)  # Deja vencer el delay (batches parciales)
+        sink.close(timeout=2.0)
+
+        assert [m for batch in batches for m in batch] == list(range(200))
+        assert all(0 < len(batch) <= 4 for batch in batches)
+
+    def test_single_flusher_thread(self):
+        """
+        Invariante: batches parciales no crean threads nuevos (un flusher).
+        """
+        data_plane, batches = make_batch_plane()
+        sink = BatchingMQTTSink(data_plane, max_batch=100, max_delay_ms=1)
+        threads_before = threading.active_count()
+
+        for i in range(20):
+            sink(i)
+            time.sleep(0.003)
+
+        assert threading.active_count() <= threads_before
+        sink.close(timeout=2.0)
+        assert [m for batch in batches for m in batch] == list(range(20))
+
+
+@pytest.mark.unit
+@pytest.mark.mqtt
+class TestMQTTSinkFactory:
+    """Tests de _create_mqtt_sink_factory (composición del sink MQTT)"""
+
+    def make_config(self, **overrides):
+        """Helper: config mínima del factory (sin batching, QoS 0)."""
+        config = SimpleNamespace(
+            MQTT_ENABLED=True,
+            MQTT_BATCH_SIZE=1,
+            MQTT_BATCH_MS=50,
+            DATA_QOS=0,
+            MQTT_ASYNC_SINK=False,
+        )
+        for key, value in overrides.items():
+            setattr(config, key, value)
+        return config
+
+    def test_default_sink_publishes_inline(self):
+        """
+        Invariante: por defecto no hay LeakyAsyncSink (nada se descarta).
+        """
+        data_plane = Mock()
+        sink = _create_mqtt_sink_factory(self.make_config(), data_plane)
+
+        assert not isinstance(sink, LeakyAsyncSink)
+        assert sink.__name__ == 'mqtt_sink'
+
+        sink({"predictions": []}, None)
+        data_plane.publish_inference.assert_called_once_with({"predictions": []}, None)
+
+    def test_async_sink_is_opt_in(self):
+        """
+        Invariante: MQTT_ASYNC_SINK envuelve el sink en LeakyAsyncSink.
+        """
+        sink = _create_mqtt_sink_factory(self.make_config(MQTT_ASYNC_SINK=True), Mock())
+
+        assert isinstance(sink, LeakyAsyncSink)
+        assert sink.__name__ == 'mqtt_sink'
+        sink.close(timeout=2.0)
+
+    def test_pool_sink_keeps_mqtt_sink_name(self):
+        """
+        Invariante: con pool el sink round-robin se sigue llamando
+        'mqtt_sink' (lo busca wrap_sinks_with_stabilization).
+        """
+        planes = [Mock(), Mock()]
+        sink = _create_mqtt_sink_factory(
+            self.make_config(), planes[0], data_planes=planes
+        )
+
+        assert sink.__name__ == 'mqtt_sink'
+
+        sink("p1")
+        sink("p2")
+        planes[0].publish_inference.assert_called_once_with("p1", None)
+        planes[1].publish_inference.assert_called_once_with("p2", None)
+
+    def test_batching_honored_with_qos0(self):
+        """
+        Invariante: MQTT_BATCH_SIZE > 1 habilita batching también con
+        DATA_QOS = 0 (amortiza headers y writes TCP).
+        """
+        sink = _create_mqtt_sink_factory(
+            self.make_config(MQTT_BATCH_SIZE=8, DATA_QOS=0), Mock()
+        )
+
+        assert isinstance(sink, BatchingMQTTSink)
+        sink.close(timeout=2.0)
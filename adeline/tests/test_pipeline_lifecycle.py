@@ -8,34 +8,42 @@ Invariantes testeadas:
 1. STOP: pipeline.terminate() se llama + shutdown_event activado
 2. PAUSE: pipeline.pause_stream() se llama + status "paused" publicado
 3. RESUME: pipeline.resume_stream() se llama + status "running" publicado
-4. Estado is_running se actualiza correctamente
+4. Estado _terminated se actualiza correctamente
 5. Comandos ignoran si pipeline no está running
+6. _terminate_once: terminate()/join() una sola vez (doble, concurrente, antes de start)
 
   1. TestPipelineLifecycle (13 tests):
   - ✅ STOP: pipeline.terminate() se llama
   - ✅ STOP: shutdown_event se activa (CRÍTICO)
-  - ✅ STOP: is_running se setea False
+  - ✅ STOP: _terminated se setea + status "stopped"
   - ✅ PAUSE: pipeline.pause_stream() se llama
   - ✅ PAUSE: status "paused" se publica
   - ✅ RESUME: pipeline.resume_stream() se llama
   - ✅ RESUME: status "running" se publica
-  - ✅ Comandos ignorados cuando no está running
+  - ✅ PAUSE/RESUME ignorados cuando no está running
+  - ✅ STOP sin pipeline corriendo solo finaliza
   - ✅ Secuencia PAUSE→RESUME funciona
   - ✅ Edge case: Múltiples PAUSE/RESUME consecutivos
 
-  2. TestPipelineLifecycleExceptions (3 tests):
+  2. TestTerminateOnce (4 tests):
+  - ✅ Doble terminación → terminate() una vez, segunda retorna False
+  - ✅ Terminación concurrente → exactamente un ganador
+  - ✅ Terminación antes de start() → no-op
+  - ✅ terminate() que falla deja _terminated seteado
+
+  3. TestPipelineLifecycleExceptions (3 tests):
   - ✅ STOP setea shutdown_event incluso si hay excepción (CRÍTICO)
   - ✅ PAUSE maneja excepciones gracefully
   - ✅ RESUME maneja excepciones gracefully
 
-  3. TestShutdownEventBehavior (4 tests):
+  4. TestShutdownEventBehavior (4 tests):
   - ✅ shutdown_event inicia unset
   - ✅ shutdown_event.set() lo activa
   - ✅ wait() retorna inmediato cuando está set
   - ✅ wait() espera timeout cuando está unset
 
   Diseño:
-  - Mock-based (no requiere MQTT real)
+  - Controller real con pipeline/planes mockeados (no requiere MQTT real)
   - Enfocado en invariantes de lifecycle
   - Verifica flujo crítico de finalización
 
@@ -52,9 +60,41 @@ Invariantes testeadas:
 
 
 """
+import logging
+import os
+import signal
+import time
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-from threading import Event
+from concurrent.futures import Future
+from queue import Queue
+import threading
+from threading import Event, Thread
+
+import paho.mqtt.client as mqtt
+
+from adeline.app.controller import InferencePipelineController
+from adeline.data import MQTTDataPlane
+from adeline.logging import get_trace_id, trace_context
+
+
+def make_controller(**config_overrides):
+    """
+    Helper: Crea un InferencePipelineController real (sin setup()).
+
+    Solo la config que leen __init__ y los métodos bajo test; pipeline,
+    planes, etc. se asignan en cada test.
+    """
+    config = SimpleNamespace(
+        ROI_MODE='none',
+        STABILIZATION_MODE='none',
+        METRICS_INTERVAL_S=0.01,
+    )
+    for key, value in config_overrides.items():
+        setattr(config, key, value)
+    return InferencePipelineController(config)
 
 
 @pytest.mark.integration
@@ -62,55 +102,32 @@ from threading import Event
 class TestPipelineLifecycle:
     """Integration tests para lifecycle del InferencePipelineController"""
 
-    def create_mock_controller(self):
+    def create_running_controller(self):
         """
-        Helper: Crea un controller mock con componentes mínimos.
+        Helper: Controller real con pipeline y control plane mockeados.
 
         Returns:
-            controller con pipeline, control_plane, shutdown_event mockeados
+            controller "corriendo" (_terminated limpio, como tras start())
         """
-        # Mock controller manualmente (sin importar para evitar dependencias)
-        controller = Mock()
+        controller = make_controller()
         controller.pipeline = Mock()
         controller.control_plane = Mock()
         controller.data_plane = Mock()
-        controller.shutdown_event = Event()
-        controller.is_running = True
-
-        # Mock methods (copiar lógica del controller)
-        def handle_stop():
-            if controller.is_running:
-                controller.pipeline.terminate()
-                controller.is_running = False
-                controller.shutdown_event.set()
-
-        def handle_pause():
-            if controller.is_running:
-                controller.pipeline.pause_stream()
-                controller.control_plane.publish_status("paused")
-
-        def handle_resume():
-            if controller.is_running:
-                controller.pipeline.resume_stream()
-                controller.control_plane.publish_status("running")
-
-        controller.handle_stop = handle_stop
-        controller.handle_pause = handle_pause
-        controller.handle_resume = handle_resume
-
+        controller._terminated.clear()
         return controller
 
     def test_stop_command_terminates_pipeline(self):
         """
-        Invariante: Comando STOP llama pipeline.terminate().
+        Invariante: Comando STOP llama pipeline.terminate() y join().
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Execute STOP
-        controller.handle_stop()
+        controller._handle_stop()
 
         # Verificar pipeline.terminate() fue llamado
         controller.pipeline.terminate.assert_called_once()
+        controller.pipeline.join.assert_called_once()
 
     def test_stop_command_sets_shutdown_event(self):
         """
@@ -118,40 +135,41 @@ class TestPipelineLifecycle:
 
         Este es el mecanismo de finalización del programa.
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Precondición
         assert not controller.shutdown_event.is_set()
 
         # Execute STOP
-        controller.handle_stop()
+        controller._handle_stop()
 
         # Postcondición
         assert controller.shutdown_event.is_set()
 
-    def test_stop_command_sets_is_running_false(self):
+    def test_stop_command_marks_terminated(self):
         """
-        Invariante: Comando STOP setea is_running = False.
+        Invariante: Comando STOP setea _terminated y publica "stopped".
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Precondición
-        assert controller.is_running is True
+        assert not controller._terminated.is_set()
 
         # Execute STOP
-        controller.handle_stop()
+        controller._handle_stop()
 
         # Postcondición
-        assert controller.is_running is False
+        assert controller._terminated.is_set()
+        controller.control_plane.publish_status.assert_called_once_with("stopped", qos=0)
 
     def test_pause_command_pauses_stream(self):
         """
         Invariante: Comando PAUSE llama pipeline.pause_stream().
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Execute PAUSE
-        controller.handle_pause()
+        controller._handle_pause()
 
         # Verificar
         controller.pipeline.pause_stream.assert_called_once()
@@ -160,10 +178,10 @@ class TestPipelineLifecycle:
         """
         Invariante: Comando PAUSE publica status "paused" vía control plane.
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Execute PAUSE
-        controller.handle_pause()
+        controller._handle_pause()
 
         # Verificar status publicado
         controller.control_plane.publish_status.assert_called_once_with("paused")
@@ -172,10 +190,10 @@ class TestPipelineLifecycle:
         """
         Invariante: Comando RESUME llama pipeline.resume_stream().
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Execute RESUME
-        controller.handle_resume()
+        controller._handle_resume()
 
         # Verificar
         controller.pipeline.resume_stream.assert_called_once()
@@ -184,10 +202,10 @@ class TestPipelineLifecycle:
         """
         Invariante: Comando RESUME publica status "running" vía control plane.
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Execute RESUME
-        controller.handle_resume()
+        controller._handle_resume()
 
         # Verificar status publicado
         controller.control_plane.publish_status.assert_called_once_with("running")
@@ -196,11 +214,11 @@ class TestPipelineLifecycle:
         """
         Invariante: PAUSE es ignorado si pipeline no está running.
         """
-        controller = self.create_mock_controller()
-        controller.is_running = False
+        controller = self.create_running_controller()
+        controller._terminated.set()
 
         # Execute PAUSE
-        controller.handle_pause()
+        controller._handle_pause()
 
         # No debe llamar a pipeline
         controller.pipeline.pause_stream.assert_not_called()
@@ -210,45 +228,47 @@ class TestPipelineLifecycle:
         """
         Invariante: RESUME es ignorado si pipeline no está running.
         """
-        controller = self.create_mock_controller()
-        controller.is_running = False
+        controller = self.create_running_controller()
+        controller._terminated.set()
 
         # Execute RESUME
-        controller.handle_resume()
+        controller._handle_resume()
 
         # No debe llamar a pipeline
         controller.pipeline.resume_stream.assert_not_called()
         controller.control_plane.publish_status.assert_not_called()
 
-    def test_stop_ignored_when_not_running(self):
+    def test_stop_when_not_running_only_finalizes(self):
         """
-        Invariante: STOP es ignorado si pipeline no está running.
+        Invariante: STOP con pipeline ya parado no vuelve a terminarlo,
+        pero igual finaliza el programa.
         """
-        controller = self.create_mock_controller()
-        controller.is_running = False
+        controller = self.create_running_controller()
+        controller._terminated.set()
 
         # Execute STOP
-        controller.handle_stop()
+        controller._handle_stop()
 
         # No debe llamar a pipeline.terminate()
         controller.pipeline.terminate.assert_not_called()
-        # shutdown_event NO debe setearse (ya parado)
-        assert not controller.shutdown_event.is_set()
+        controller.pipeline.join.assert_not_called()
+        # shutdown_event se setea igual (STOP siempre finaliza)
+        assert controller.shutdown_event.is_set()
 
     def test_pause_resume_sequence(self):
         """
         Secuencia: PAUSE → RESUME debe funcionar correctamente.
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Step 1: PAUSE
-        controller.handle_pause()
+        controller._handle_pause()
         controller.pipeline.pause_stream.assert_called_once()
         controller.control_plane.publish_status.assert_called_with("paused")
 
         # Step 2: RESUME
         controller.control_plane.reset_mock()  # Reset para verificar próxima llamada
-        controller.handle_resume()
+        controller._handle_resume()
         controller.pipeline.resume_stream.assert_called_once()
         controller.control_plane.publish_status.assert_called_with("running")
 
@@ -258,12 +278,12 @@ class TestPipelineLifecycle:
 
         (El pipeline interno maneja idempotencia)
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Múltiples PAUSE
-        controller.handle_pause()
-        controller.handle_pause()
-        controller.handle_pause()
+        controller._handle_pause()
+        controller._handle_pause()
+        controller._handle_pause()
 
         # Debe llamar pause_stream 3 veces (idempotente a nivel pipeline)
         assert controller.pipeline.pause_stream.call_count == 3
@@ -272,61 +292,114 @@ class TestPipelineLifecycle:
         """
         Edge case: Múltiples RESUME consecutivos deben ser permitidos.
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Múltiples RESUME
-        controller.handle_resume()
-        controller.handle_resume()
-        controller.handle_resume()
+        controller._handle_resume()
+        controller._handle_resume()
+        controller._handle_resume()
 
         # Debe llamar resume_stream 3 veces
         assert controller.pipeline.resume_stream.call_count == 3
 
 
+@pytest.mark.integration
+@pytest.mark.mqtt
+class TestTerminateOnce:
+    """Tests de _terminate_once (terminación idempotente del pipeline)"""
+
+    def create_running_controller(self):
+        """Helper: Controller real "corriendo" con pipeline mockeado"""
+        controller = make_controller()
+        controller.pipeline = Mock()
+        controller._terminated.clear()
+        return controller
+
+    def test_double_termination_terminates_once(self):
+        """
+        Invariante: la segunda llamada retorna False sin volver a
+        llamar terminate()/join().
+        """
+        controller = self.create_running_controller()
+
+        assert controller._terminate_once() is True
+        assert controller._terminate_once() is False
+
+        controller.pipeline.terminate.assert_called_once()
+        controller.pipeline.join.assert_called_once()
+
+    def test_concurrent_termination_terminates_once(self):
+        """
+        Invariante: STOP (worker) y cleanup() (main) compitiendo solo
+        terminan el pipeline una vez; exactamente uno gana.
+        """
+        controller = self.create_running_controller()
+        # terminate() lento: los demás threads llegan mientras el primero termina
+        controller.pipeline.terminate.side_effect = lambda: time.sleep(0.05)
+
+        barrier = threading.Barrier(8)
+        results = []
+        results_lock = threading.Lock()
+
+        def terminate():
+            barrier.wait()
+            result = controller._terminate_once()
+            with results_lock:
+                results.append(result)
+
+        threads = [Thread(target=terminate) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=2.0)
+
+        assert sorted(results) == [False] * 7 + [True]
+        controller.pipeline.terminate.assert_called_once()
+        controller.pipeline.join.assert_called_once()
+
+    def test_termination_before_start_is_noop(self):
+        """
+        Invariante: antes de start() (_terminated seteado de fábrica)
+        no hay nada que terminar.
+        """
+        controller = make_controller()
+        controller.pipeline = Mock()
+
+        assert controller._terminated.is_set()
+        assert controller._terminate_once() is False
+
+        controller.pipeline.terminate.assert_not_called()
+        controller.pipeline.join.assert_not_called()
+
+    def test_terminate_error_still_marks_terminated(self):
+        """
+        Invariante: si terminate() falla, _terminated queda seteado y
+        STOP igual finaliza el programa.
+        """
+        controller = self.create_running_controller()
+        controller.control_plane = Mock()
+        controller.pipeline.terminate.side_effect = RuntimeError("Pipeline error")
+
+        controller._handle_stop()
+
+        assert controller._terminated.is_set()
+        assert controller.shutdown_event.is_set()
+        # Un segundo intento (cleanup) no reintenta
+        assert controller._terminate_once() is False
+        controller.pipeline.terminate.assert_called_once()
+
+
 @pytest.mark.integration
 @pytest.mark.mqtt
 class TestPipelineLifecycleExceptions:
     """Tests de manejo de excepciones en lifecycle"""
 
-    def create_mock_controller(self):
-        """Helper: Crea controller con métodos mockeados"""
-        controller = Mock()
+    def create_running_controller(self):
+        """Helper: Controller real "corriendo" con pipeline mockeado"""
+        controller = make_controller()
         controller.pipeline = Mock()
         controller.control_plane = Mock()
-        controller.shutdown_event = Event()
-        controller.is_running = True
-
-        # Mock handle methods con exception handling
-        def handle_stop():
-            if controller.is_running:
-                try:
-                    controller.pipeline.terminate()
-                    controller.is_running = False
-                    controller.shutdown_event.set()
-                except Exception:
-                    # Exception handled, pero shutdown_event se setea igual
-                    controller.shutdown_event.set()
-
-        def handle_pause():
-            if controller.is_running:
-                try:
-                    controller.pipeline.pause_stream()
-                    controller.control_plane.publish_status("paused")
-                except Exception:
-                    pass  # Exception handled
-
-        def handle_resume():
-            if controller.is_running:
-                try:
-                    controller.pipeline.resume_stream()
-                    controller.control_plane.publish_status("running")
-                except Exception:
-                    pass  # Exception handled
-
-        controller.handle_stop = handle_stop
-        controller.handle_pause = handle_pause
-        controller.handle_resume = handle_resume
-
+        controller._terminated.clear()
         return controller
 
     def test_stop_sets_shutdown_event_even_on_exception(self):
@@ -335,13 +408,13 @@ class TestPipelineLifecycleExceptions:
 
         Incluso si pipeline.terminate() falla, el programa debe finalizar.
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Simular excepción en terminate()
         controller.pipeline.terminate.side_effect = RuntimeError("Pipeline error")
 
         # Execute STOP
-        controller.handle_stop()
+        controller._handle_stop()
 
         # shutdown_event DEBE estar seteado (garantizar finalización)
         assert controller.shutdown_event.is_set()
@@ -350,31 +423,33 @@ class TestPipelineLifecycleExceptions:
         """
         Comportamiento: PAUSE maneja excepciones de pipeline sin crash.
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Simular excepción
         controller.pipeline.pause_stream.side_effect = RuntimeError("Pause error")
 
         # No debe propagar excepción
-        controller.handle_pause()  # No debe lanzar
+        controller._handle_pause()  # No debe lanzar
 
         # Verificar que intentó llamar
         controller.pipeline.pause_stream.assert_called_once()
+        controller.control_plane.publish_status.assert_not_called()
 
     def test_resume_handles_pipeline_exception_gracefully(self):
         """
         Comportamiento: RESUME maneja excepciones de pipeline sin crash.
         """
-        controller = self.create_mock_controller()
+        controller = self.create_running_controller()
 
         # Simular excepción
         controller.pipeline.resume_stream.side_effect = RuntimeError("Resume error")
 
         # No debe propagar excepción
-        controller.handle_resume()  # No debe lanzar
+        controller._handle_resume()  # No debe lanzar
 
         # Verificar que intentó llamar
         controller.pipeline.resume_stream.assert_called_once()
+        controller.control_plane.publish_status.assert_not_called()
 
 
 @pytest.mark.integration
@@ -439,3 +514,367 @@ class TestShutdownEventBehavior:
 
         assert result is False  # Event NO está set
         assert elapsed >= 0.1  # Esperó el timeout
+
+
+@pytest.mark.integration
+@pytest.mark.mqtt
+class TestMetricsLoop:
+    """Tests del worker de métricas periódicas (_metrics_loop)"""
+
+    def test_one_iteration_publishes_and_stores_snapshot(self, caplog):
+        """
+        Invariante: una iteración publica métricas vía MQTTDataPlane real y
+        guarda el snapshot para el comando METRICS.
+        """
+        caplog.set_level(logging.INFO)
+        controller = make_controller()
+
+        plane = MQTTDataPlane(broker_host="localhost")
+        plane.client = Mock()
+        plane._connected.set()
+
+        report = Mock(inference_throughput=30.0, latency_reports=[], sources_metadata=[])
+        watchdog = Mock()
+        watchdog.get_report.return_value = report
+        plane.set_watchdog(watchdog)
+
+        # El primer publish corta el loop: exactamente una iteración
+        def publish(*args, **kwargs):
+            controller.shutdown_event.set()
+            return Mock(rc=mqtt.MQTT_ERR_SUCCESS)
+
+        plane.client.publish.side_effect = publish
+        controller.data_plane = plane
+        controller._terminated.clear()
+
+        controller._metrics_loop()
+
+        plane.client.publish.assert_called_once()
+        assert controller._metrics_snapshot is not None
+        assert controller._metrics_snapshot["throughput_fps"] == 30.0
+        assert not any(r.levelno >= logging.ERROR for r in caplog.records)
+        # Publicación periódica: log de métricas en DEBUG, no INFO
+        assert not any(hasattr(r, "metrics") for r in caplog.records)
+
+    def test_loop_exits_when_pipeline_terminated(self):
+        """
+        Invariante: con el pipeline terminado el worker sale sin publicar.
+        """
+        controller = make_controller()
+        controller.data_plane = Mock()
+        # _terminated arranca seteado (pipeline no iniciado)
+
+        controller._metrics_loop()
+
+        controller.data_plane.publish_metrics.assert_not_called()
+        assert controller._metrics_snapshot is None
+
+    def test_metrics_command_reuses_snapshot_while_worker_alive(self):
+        """
+        Invariante: con el worker vivo, METRICS re-publica su snapshot.
+        """
+        controller = make_controller()
+        controller.data_plane = Mock()
+        controller._terminated.clear()
+        controller._metrics_snapshot = {"throughput_fps": 30.0}
+        controller._metrics_worker = Mock()
+        controller._metrics_worker.is_alive.return_value = True
+
+        controller._handle_metrics()
+
+        controller.data_plane.publish_metrics.assert_called_once_with({"throughput_fps": 30.0})
+
+    @pytest.mark.parametrize("worker_alive, terminated", [
+        (None, False),   # metrics_interval_s: 0 → sin worker
+        (False, False),  # worker terminado
+        (True, True),    # pipeline terminado (el worker sale en su próximo tick)
+    ])
+    def test_metrics_command_publishes_fresh_without_live_worker(self, worker_alive, terminated):
+        """
+        Invariante: sin worker que refresque el snapshot, cada METRICS
+        formatea en el momento y no guarda el resultado.
+        """
+        controller = make_controller()
+        controller.data_plane = Mock()
+        controller.data_plane.publish_metrics.side_effect = [{"n": 1}, {"n": 2}]
+        if worker_alive is not None:
+            controller._metrics_worker = Mock()
+            controller._metrics_worker.is_alive.return_value = worker_alive
+            controller._metrics_snapshot = {"n": 0}
+        if not terminated:
+            controller._terminated.clear()
+        snapshot_before = controller._metrics_snapshot
+
+        controller._handle_metrics()
+        controller._handle_metrics()
+
+        assert controller.data_plane.publish_metrics.call_args_list == [((),), ((),)]
+        assert controller._metrics_snapshot is snapshot_before
+
+
+@pytest.mark.integration
+@pytest.mark.mqtt
+class TestCommandQueue:
+    """Tests de la cola de comandos (_enqueue_command / _cmd_loop)"""
+
+    def drain(self, controller, queue):
+        """Helper: corre el worker hasta vaciar la cola (None = fin)."""
+        worker = Thread(target=controller._cmd_loop, args=(queue,), daemon=True)
+        worker.start()
+        queue.put(None, timeout=2.0)
+        worker.join(timeout=2.0)
+        assert not worker.is_alive()
+
+    def test_commands_run_in_arrival_order(self):
+        """
+        Invariante: el worker ejecuta los comandos en orden de llegada.
+        """
+        controller = make_controller()
+        calls = []
+
+        def make_handler(name):
+            def handler():
+                calls.append(name)
+            handler.__name__ = name
+            return handler
+
+        for name in ("pause", "resume", "stop"):
+            controller._enqueue_command(make_handler(name))()
+
+        self.drain(controller, controller._cmd_queue)
+
+        assert calls == ["pause", "resume", "stop"]
+
+    def test_full_queue_drops_command_with_warning(self, caplog):
+        """
+        Invariante: con la cola llena el comando se descarta (warning) sin
+        bloquear el thread de paho; los encolados se ejecutan igual.
+        """
+        controller = make_controller()
+        queue = Queue(maxsize=2)
+        handler = Mock(__name__="_handle_pause")
+        enqueue = controller._enqueue_command(handler, queue)
+
+        enqueue()
+        enqueue()
+        enqueue()  # Cola llena → descartado
+
+        assert queue.qsize() == 2
+        dropped = [r for r in caplog.records if getattr(r, "event", None) == "command_dropped"]
+        assert len(dropped) == 1
+        assert dropped[0].queue_size == 2
+
+        self.drain(controller, queue)
+        assert handler.call_count == 2
+
+    def test_handler_runs_with_enqueue_trace_id(self):
+        """
+        Invariante: el handler corre en el worker con el trace_id del
+        contexto en que se encoló (correlation de logs del comando).
+        """
+        controller = make_controller()
+        seen = []
+
+        def handler():
+            seen.append(get_trace_id())
+
+        with trace_context("cmd-pause-test"):
+            controller._enqueue_command(handler)()
+
+        assert get_trace_id() is None
+        self.drain(controller, controller._cmd_queue)
+
+        assert seen == ["cmd-pause-test"]
+
+    def test_failing_handler_does_not_stop_worker(self):
+        """
+        Invariante: una excepción en un handler se loguea y el worker sigue.
+        """
+        controller = make_controller()
+        after = Mock(__name__="_handle_status")
+
+        def failing():
+            raise RuntimeError("boom")
+
+        controller._enqueue_command(failing)()
+        controller._enqueue_command(after)()
+
+        self.drain(controller, controller._cmd_queue)
+
+        after.assert_called_once()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not hasattr(signal, 'pthread_sigmask'), reason="requiere pthread_sigmask")
+class TestSignalHandling:
+    """Tests de señales en run() (máscara + sigwait en signal-waiter)"""
+
+    @pytest.fixture(autouse=True)
+    def stray_sigterm(self):
+        """
+        SIGTERM sin handler Python mata el proceso: si una señal de test
+        llegara a un thread sin máscara, se registra acá y el test falla.
+        """
+        stray = []
+        previous = signal.signal(signal.SIGTERM, lambda signum, frame: stray.append(signum))
+        yield stray
+        signal.signal(signal.SIGTERM, previous)
+
+    def signal_records(self, caplog):
+        return [r for r in caplog.records if getattr(r, "event", None) == "signal_received"]
+
+    def test_run_restores_signal_state(self):
+        """
+        Invariante: al retornar run() quedan la máscara previa y el
+        signal-waiter terminó (no consume señales ajenas).
+        """
+        controller = make_controller()
+        controller.setup = Mock(return_value=False)
+
+        mask_before = signal.pthread_sigmask(signal.SIG_BLOCK, [])
+
+        controller.run()
+
+        assert signal.pthread_sigmask(signal.SIG_BLOCK, []) == mask_before
+        assert not any(
+            t.name == "signal-waiter" and t.is_alive() for t in threading.enumerate()
+        )
+
+    def test_sigterm_during_setup_interrupts_once(self, caplog, stray_sigterm):
+        """
+        Invariante CRÍTICO: SIGTERM durante setup() corta el setup con un
+        único KeyboardInterrupt (sin re-entrar al handler) y termina en
+        cleanup.
+        """
+        caplog.set_level(logging.INFO)
+        controller = make_controller()
+        controller.cleanup = Mock()
+        interrupted = []
+
+        def setup():
+            os.kill(os.getpid(), signal.SIGTERM)
+            try:
+                # Carga de modelo simulada: ejecuta bytecode hasta el interrupt
+                deadline = time.monotonic() + 2.0
+                while time.monotonic() < deadline:
+                    time.sleep(0.01)
+            except KeyboardInterrupt:
+                interrupted.append(True)
+                raise
+            return True
+
+        controller.setup = setup
+
+        controller.run()
+
+        assert interrupted == [True]
+        assert len(self.signal_records(caplog)) == 1
+        assert controller.shutdown_event.is_set()
+        controller.cleanup.assert_called_once()
+        assert stray_sigterm == []
+
+    def test_sigterm_after_setup_wakes_wait(self, caplog, stray_sigterm):
+        """
+        Invariante: con setup() terminado, SIGTERM solo setea
+        shutdown_event; el wait() sin timeout despierta y corre cleanup.
+        """
+        caplog.set_level(logging.INFO)
+        controller = make_controller()
+        controller.setup = Mock(return_value=True)
+        controller.cleanup = Mock()
+
+        def banner():
+            os.kill(os.getpid(), signal.SIGTERM)
+            return ""
+
+        controller._build_banner = banner
+
+        start = time.monotonic()
+        controller.run()
+
+        assert time.monotonic() - start < 1.0
+        assert len(self.signal_records(caplog)) == 1
+        assert controller.shutdown_event.is_set()
+        controller.cleanup.assert_called_once()
+        assert stray_sigterm == []
+
+    def test_stop_command_wakes_wait(self):
+        """
+        Invariante: STOP desde otro thread (worker de comandos) despierta
+        el wait() sin timeout de inmediato, sin esperar ningún poll.
+        """
+        controller = make_controller()
+        controller.setup = Mock(return_value=True)
+        controller.cleanup = Mock()
+        controller.control_plane = Mock()
+
+        def banner():
+            Thread(target=controller._handle_stop, daemon=True).start()
+            return ""
+
+        controller._build_banner = banner
+
+        start = time.monotonic()
+        controller.run()
+
+        assert time.monotonic() - start < 1.0
+        controller.control_plane.publish_status.assert_called_once_with("stopped", qos=0)
+        controller.cleanup.assert_called_once()
+
+
+@pytest.mark.integration
+@pytest.mark.mqtt
+class TestSetupConnections:
+    """Tests de _await_connections (connects MQTT en paralelo en setup)"""
+
+    def make_connection(self, component, result=None):
+        """Helper: (componente, plane mock, future); result None = en vuelo."""
+        future = Future()
+        if result is not None:
+            future.set_result(result)
+        return (component, Mock(client_id=f"{component}_client"), future)
+
+    def test_all_connected(self):
+        """
+        Invariante: todos conectados → True, nadie se desconecta.
+        """
+        controller = make_controller(MQTT_BROKER="localhost", MQTT_PORT=1883)
+        connections = [
+            self.make_connection("data_plane", True),
+            self.make_connection("control_plane", True),
+        ]
+
+        assert controller._await_connections(connections) is True
+        for _, plane, _ in connections:
+            plane.disconnect.assert_not_called()
+
+    def test_failure_disconnects_every_started_plane(self):
+        """
+        Invariante: ante un fallo se desconectan todos los planes (también
+        los ya conectados y el rechazado); los en vuelo al terminar.
+        """
+        controller = make_controller(MQTT_BROKER="localhost", MQTT_PORT=1883)
+        connected = self.make_connection("data_plane", True)
+        failed = self.make_connection("control_plane", False)
+        in_flight = self.make_connection("data_plane")
+
+        assert controller._await_connections([connected, failed, in_flight]) is False
+
+        connected[1].disconnect.assert_called_once()
+        failed[1].disconnect.assert_called_once()
+        in_flight[1].disconnect.assert_not_called()  # No se espera su timeout
+
+        in_flight[2].set_result(False)
+        in_flight[1].disconnect.assert_called_once()
+
+    def test_disconnect_error_does_not_propagate(self):
+        """
+        Invariante: un error desconectando un plane no corta el resto.
+        """
+        controller = make_controller(MQTT_BROKER="localhost", MQTT_PORT=1883)
+        failed = self.make_connection("data_plane", False)
+        failed[1].disconnect.side_effect = RuntimeError("socket closed")
+        other = self.make_connection("control_plane", True)
+
+        assert controller._await_connections([failed, other]) is False
+        other[1].disconnect.assert_called_once()
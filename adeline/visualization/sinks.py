@@ -298,12 +298,11 @@ def create_visualization_sink(
     Returns:
         Función sink lista para usar con InferencePipeline
     """
-    from functools import partial
-
-    return partial(
-        render_predictions_with_roi,
-        roi_state=roi_state,
-        inference_handler=inference_handler,
-        display_stats=display_stats,
-        window_name=window_name,
-    )
+    # Closure con args posicionales (sin trampolín de partial ni kwargs por frame)
+    def visualization_sink(predictions, video_frames):
+        render_predictions_with_roi(
+            predictions, video_frames,
+            roi_state, inference_handler, display_stats, window_name,
+        )
+
+    return visualization_sink